@@ -10,6 +10,7 @@ import sys
 from pathlib import Path
 import io
 import os
+from functools import partial
 
 # Add project root to Python path so 'src' is importable
 ROOT_DIR = Path(__file__).resolve().parent
@@ -53,6 +54,68 @@ def setup_logging():
     )
 
 
+def initialize_database(db_manager, db_path):
+    """Create the schema; on SQLite, retry once after creating the file by hand.
+
+    Runs on the database manager's background init thread.
+    """
+    logger = logging.getLogger(__name__)
+    try:
+        db_manager.init_database()
+        logger.info("✅ Database initialized successfully")
+    
+        # Log database info
+        info = db_manager.get_database_info()
+        logger.info(f"📊 Database Information:")
+        logger.info(f"  📁 Path: {info.get('database_path', 'Unknown')}")
+        logger.info(f"  💾 Size: {info.get('database_size_mb', 0)} MB")
+        table_counts = info.get('table_counts', {})
+        if table_counts:
+            logger.info("  📋 Tables:")
+            for table, count in table_counts.items():
+                logger.info(f"    • {table}: {count} records")
+        else:
+            logger.warning("⚠️ No table information found - database may not be initialized properly")
+        
+    except Exception as e:
+        logger.error(f"❌ Database initialization failed: {e}")
+        if db_manager.db_type != 'sqlite':
+            raise
+        logger.error("🔄 Attempting to create database manually...")
+    
+        # Try to create database manually
+        try:
+            import sqlite3
+            from pathlib import Path
+        
+            logger.info(f"📁 Creating database at: {db_path}")
+        
+            # Ensure directory exists
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+            logger.info(f"📁 Directory created: {Path(db_path).parent}")
+        
+            # Create database file
+            conn = sqlite3.connect(db_path)
+            conn.close()
+            logger.info("✅ Database file created successfully")
+        
+            # Try initialization again
+            db_manager.init_database()
+            logger.info("✅ Database initialized successfully on retry")
+        
+            # Verify tables were created
+            info = db_manager.get_database_info()
+            table_counts = info.get('table_counts', {})
+            if table_counts:
+                logger.info("  📋 Tables created:")
+                for table, count in table_counts.items():
+                    logger.info(f"    • {table}: {count} records")
+        
+        except Exception as e2:
+            logger.error(f"❌ Manual database creation also failed: {e2}")
+            raise
+
+
 def main():
     """Main application entry point."""
     try:
@@ -65,7 +128,8 @@ def main():
         logger.info(f"📁 Source path: {SRC_DIR}")
 
         # Initialize database
-        from src.database.database import db_manager
+        from src.database.database import get_db_manager
+        db_manager = get_db_manager()
         logger.info("📊 Initializing database...")
         
         # First, verify database setup
@@ -74,62 +138,16 @@ def main():
         logger.info(f"📁 Database path: {db_path}")
         logger.info(f"📁 Database exists: {os.path.exists(db_path)}")
         
-        try:
-            db_manager.init_database()
-            logger.info("✅ Database initialized successfully")
-            
-            # Log database info
-            info = db_manager.get_database_info()
-            logger.info(f"📊 Database Information:")
-            logger.info(f"  📁 Path: {info.get('database_path', 'Unknown')}")
-            logger.info(f"  💾 Size: {info.get('database_size_mb', 0)} MB")
-            table_counts = info.get('table_counts', {})
-            if table_counts:
-                logger.info("  📋 Tables:")
-                for table, count in table_counts.items():
-                    logger.info(f"    • {table}: {count} records")
-            else:
-                logger.warning("⚠️ No table information found - database may not be initialized properly")
-                
-        except Exception as e:
-            logger.error(f"❌ Database initialization failed: {e}")
-            logger.error("🔄 Attempting to create database manually...")
-            
-            # Try to create database manually
-            try:
-                import sqlite3
-                from pathlib import Path
-                
-                logger.info(f"📁 Creating database at: {db_path}")
-                
-                # Ensure directory exists
-                Path(db_path).parent.mkdir(parents=True, exist_ok=True)
-                logger.info(f"📁 Directory created: {Path(db_path).parent}")
-                
-                # Create database file
-                conn = sqlite3.connect(db_path)
-                conn.close()
-                logger.info("✅ Database file created successfully")
-                
-                # Try initialization again
-                db_manager.init_database()
-                logger.info("✅ Database initialized successfully on retry")
-                
-                # Verify tables were created
-                info = db_manager.get_database_info()
-                table_counts = info.get('table_counts', {})
-                if table_counts:
-                    logger.info("  📋 Tables created:")
-                    for table, count in table_counts.items():
-                        logger.info(f"    • {table}: {count} records")
-                
-            except Exception as e2:
-                logger.error(f"❌ Manual database creation also failed: {e2}")
-                raise
+        # Initialize in the background so the bot can connect to Telegram
+        # meanwhile; database calls from other threads wait until it is done.
+        db_manager.init_database_in_background(partial(initialize_database, db_manager, db_path))
 
         # Create and start the bot
         bot = ReadingTrackerBot()
-        bot.start()
+        try:
+            bot.start()
+        finally:
+            db_manager.close_all()
 
     except KeyboardInterrupt:
         logger = logging.getLogger(__name__)
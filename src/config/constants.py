@@ -140,6 +140,54 @@ DEFAULT_FEATURED_BOOKS = [
     }
 ]
 
+# Default achievement definitions, seeded into achievement_definitions: (type, title, description, icon, xp_reward)
+DEFAULT_ACHIEVEMENTS = (
+    # Bronze Level (1-30 days)
+    ('1_day_streak', '🥉 First Step', 'Started your reading journey', '🥉', 10),
+    ('3_day_streak', '🥉 First Spark', 'You\'ve built your first streak 🔥 Keep going!', '🥉', 25),
+    ('7_day_streak', '🥉 One Week Reader', '1 full week of reading! Consistency pays off 🌱', '🥉', 50),
+    ('14_day_streak', '🥉 Two-Week Challenger', 'Two weeks strong! Building momentum', '🥉', 100),
+    ('21_day_streak', '🥉 Habit Builder', '21 days = new habit formed 💪', '🥉', 150),
+    ('30_day_streak', '🥉 One Month Champion', 'One month of consistent reading!', '🥉', 200),
+    # Silver Level (31-100 days)
+    ('50_day_streak', '🥈 Golden Streak', '50 days of dedication! Shining bright', '🥈', 400),
+    ('75_day_streak', '🥈 Dedicated Reader', '75 days! Your dedication is inspiring', '🥈', 600),
+    ('100_day_streak', '🥈 Century Club', '100 days! Welcome to the Century Club 🎉', '🥈', 1000),
+    # Gold Level (101-250 days)
+    ('150_day_streak', '🥇 Unstoppable', '150 days! You are truly unstoppable', '🥇', 1500),
+    ('200_day_streak', '🥇 Marathon Mind', '200 days! Your mind is a reading marathon', '🥇', 2000),
+    ('250_day_streak', '🥇 Knowledge Seeker', '250 days! A true seeker of knowledge', '🥇', 2500),
+    # Diamond Level (251+ days)
+    ('300_day_streak', '💎 Book Sage', '300 days! You are a true book sage', '💎', 3000),
+    ('365_day_streak', '💎 One-Year Legend', '365 days! You are a reading legend 👑', '💎', 5000),
+    # Book completion achievements
+    ('first_book', '📖 First Book', 'Complete your first book', '📖', 100),
+    ('5_books', '📚 Book Collector', 'Complete 5 books', '📚', 300),
+    ('10_books', '📚 Book Lover', 'Complete 10 books', '📚', 600),
+    ('25_books', '📚 Book Enthusiast', 'Complete 25 books', '📚', 1500),
+    ('50_books', '📚 Book Master', 'Complete 50 books', '📚', 3000),
+    # Page reading achievements
+    ('100_pages', '📄 Page Turner', 'Read 100 pages', '📄', 50),
+    ('500_pages', '📄 Page Reader', 'Read 500 pages', '📄', 200),
+    ('1000_pages', '📄 Page Devourer', 'Read 1000 pages', '📄', 500),
+    ('5000_pages', '📄 Page Master', 'Read 5000 pages', '📄', 2000),
+    # Reading style achievements
+    ('speed_reader', '⚡ Speed Reader', 'Read 50+ pages in a single day', '⚡', 100),
+    ('consistent_reader', '📅 Consistent Reader', 'Read every day for a week', '📅', 150),
+    ('marathon_reader', '🏃 Marathon Reader', 'Read 100+ pages in a single day', '🏃', 200),
+    # Community achievements
+    ('community_contributor', '🌟 Community Star', 'Participate in a reading league', '🌟', 100),
+    ('league_champion', '🏆 League Champion', 'Win a reading league', '🏆', 500),
+    # League-specific achievements
+    ('league_100_pages', '🏆 League 100 Pages', 'Read 100 pages in a league', '🏆', 20),
+    ('league_500_pages', '🏆 League 500 Pages', 'Read 500 pages in a league', '🏆', 100),
+    ('league_1000_pages', '🏆 League 1000 Pages', 'Read 1000 pages in a league', '🏆', 200),
+    ('league_2000_pages', '🏆 League 2000 Pages', 'Read 2000 pages in a league', '🏆', 400),
+    ('league_first_book', '📚 League First Book', 'Complete your first book in a league', '📚', 150),
+    ('league_weekly_leader', '👑 Weekly Leader', 'Top reader for a week in a league', '👑', 300),
+    ('league_monthly_champion', '🏆 Monthly Champion', 'Top reader for a month in a league', '🏆', 600),
+)
+
 # Emoji Constants
 EMOJIS = {
     "book": "📚",
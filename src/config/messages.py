@@ -377,6 +377,13 @@ USER_STATS_MESSAGE = """
 {achievements_list}
 """
 
+STATS_SUMMARY_MESSAGE = """📊 Your Stats
+
+📚 Books Started: {total_books}
+🏁 Books Completed: {completed_books}
+📖 Total Pages Read: {total_pages}
+"""
+
 LEAGUE_STATS_MESSAGE = """
 👥 League Statistics
 
@@ -29,6 +29,7 @@ ADMIN_USER_IDS = [
 # Database Configuration
 # DATABASE_PATH = os.getenv('DATABASE_PATH', BASE_DIR / 'reading_tracker.db')
 DB_TYPE = os.getenv('DB_TYPE', 'postgres')  # 'sqlite' or 'postgres'
+DB_DRIVER = os.getenv('DB_DRIVER', 'psycopg2')  # 'psycopg2' or 'asyncpg' (adds an async pool)
 
 # Postgres Settings
 DB_HOST = os.getenv('DB_HOST', 'localhost')
@@ -40,6 +41,11 @@ DB_PASSWORD = os.getenv('DB_PASSWORD')
 # SQLite Fallback (for local testing without PG)
 SQLITE_DB_PATH = os.getenv('DATABASE_PATH', BASE_DIR / 'reading_tracker.db')
 
+# Connection pool sizes
+DB_POOL_MIN_SIZE = int(os.getenv('DB_POOL_MIN_SIZE', '2'))
+DB_POOL_MAX_SIZE = int(os.getenv('DB_POOL_MAX_SIZE', '20'))
+SQLITE_POOL_SIZE = int(os.getenv('SQLITE_POOL_SIZE', '4'))
+
 # Google Sheets Configuration (optional)
 GOOGLE_SHEETS_CREDENTIALS_FILE = os.getenv('GOOGLE_SHEETS_CREDENTIALS_FILE')
 SPREADSHEET_ID = os.getenv('SPREADSHEET_ID')
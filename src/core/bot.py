@@ -4,10 +4,11 @@ Main bot class for Read & Revive Bot.
 This module contains the main bot class that orchestrates all functionality.
 """
 
+import asyncio
 import logging
 import re
 from telegram import Update, InlineKeyboardMarkup, InlineKeyboardButton, ReplyKeyboardMarkup, KeyboardButton
-from telegram.ext import Application, CommandHandler, MessageHandler, CallbackQueryHandler, filters, ContextTypes
+from telegram.ext import Application, CommandHandler, MessageHandler, CallbackQueryHandler, TypeHandler, filters, ContextTypes
 from telegram.constants import ParseMode
 from telegram.ext import Defaults
 
@@ -18,14 +19,13 @@ from src.core.handlers.admin_league_handlers import AdminLeagueHandlers
 from src.core.handlers.conversation import ConversationHandlers
 from src.core.handlers.achievement_handlers import AchievementHandlers
 from src.core.handlers.profile_handlers import ProfileHandlers
-from src.services.book_service import BookService
-from src.services.reminder_service import ReminderService
 from src.services.achievement_service import AchievementService
 from src.services.motivation_service import MotivationService
 from src.services.visual_service import VisualService
 from src.services.scheduled_message_service import ScheduledMessageService
 from src.services.profile_service import ProfileService
-from src.services.factory import get_league_service
+from src.services.factory import begin_request, get_league_service, get_book_service, get_reminder_service
+from src.database.database import get_db_manager
 
 # Global mode switch keyboard - always available
 GLOBAL_MODE_KEYBOARD = ReplyKeyboardMarkup([
@@ -45,8 +45,8 @@ class ReadingTrackerBot:
         self.conversation_handlers = None
         self.achievement_handlers = None
         self.profile_handlers = None
-        self.book_service = BookService()
-        self.reminder_service = ReminderService()
+        self.book_service = get_book_service()
+        self.reminder_service = get_reminder_service()
         self.achievement_service = AchievementService()
         self.motivation_service = MotivationService()
         self.visual_service = VisualService()
@@ -146,14 +146,36 @@ class ReadingTrackerBot:
     def _init_application(self):
         try:
             defaults = Defaults(parse_mode=ParseMode.HTML)
-            self.application = Application.builder().token(BOT_TOKEN).defaults(defaults).build()
+            self.application = (
+                Application.builder()
+                .token(BOT_TOKEN)
+                .defaults(defaults)
+                .post_init(self._post_init)
+                .post_shutdown(self._post_shutdown)
+                .build()
+            )
             self.logger.info("✅ Telegram application initialized successfully")
         except Exception as e:
             self.logger.error(f"❌ Failed to initialize application: {e}")
             raise
     
+    async def _post_init(self, application: Application):
+        # Fail startup if the background schema initialization failed
+        await asyncio.to_thread(get_db_manager().wait_until_ready)
+        # Opens the asyncpg pool used by fetch_all_async when DB_DRIVER=asyncpg; no-op otherwise
+        await get_db_manager().init_async_pool()
+    
+    async def _post_shutdown(self, application: Application):
+        await get_db_manager().close_async_pool()
+    
+    async def _begin_update(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        begin_request()
+    
     def _setup_handlers(self):
         try:
+            # Runs before every other group: league lookups are cached per update
+            self.application.add_handler(TypeHandler(Update, self._begin_update), group=-1)
+            
             # /start and registration first
             self.application.add_handler(CommandHandler('start', self.user_handlers.start))
             
@@ -290,6 +312,9 @@ class ReadingTrackerBot:
             if self.application.job_queue is not None:
                 self.application.job_queue.run_repeating(self._reminder_tick, interval=60, first=5)
                 
+                # Keep SQLite planner statistics fresh
+                self.application.job_queue.run_repeating(self._db_optimize_tick, interval=15 * 60, first=15 * 60)
+                
                 # Schedule daily motivational messages
                 self.scheduled_message_service.schedule_daily_messages(self.application)
             else:
@@ -451,7 +476,7 @@ class ReadingTrackerBot:
         # Get book title
         book_title = "current book"
         try:
-            with self.book_service.db_manager.get_connection() as conn:
+            with get_db_manager().get_connection() as conn:
                 cur = conn.cursor()
                 cur.execute("SELECT title FROM books WHERE book_id = %s", (book_id,))
                 row = cur.fetchone()
@@ -702,6 +727,10 @@ class ReadingTrackerBot:
         except Exception as e:
             self.logger.error(f"Reminder tick error: {e}")
 
+    async def _db_optimize_tick(self, context):
+        # PRAGMA optimize checks out a pooled connection; keep it off the event loop
+        await asyncio.to_thread(get_db_manager().optimize)
+
     def start(self):
         try:
             self.logger.info("🚀 Starting Read & Revive Bot...")
@@ -9,10 +9,8 @@ from telegram import Update, InlineKeyboardMarkup, InlineKeyboardButton
 from telegram.ext import ContextTypes
 
 from src.config.settings import ADMIN_USER_IDS
-from src.database.database import db_manager
-from src.services.book_service import BookService
-from src.services.factory import get_league_service
-from src.services.reminder_service import ReminderService
+from src.database.database import get_db_manager
+from src.services.factory import get_league_service, get_book_service, get_reminder_service
 
 
 class AdminHandlers:
@@ -21,9 +19,9 @@ class AdminHandlers:
     def __init__(self):
         """Initialize admin handlers."""
         self.logger = logging.getLogger(__name__)
-        self.book_service = BookService()
+        self.book_service = get_book_service()
         self.league_service = get_league_service()
-        self.reminder_service = ReminderService()
+        self.reminder_service = get_reminder_service()
     
     def _is_admin(self, user_id: int) -> bool:
         """Check if user is admin."""
@@ -115,7 +113,7 @@ class AdminHandlers:
                 # Get user count for context
                 total = 0
                 try:
-                    with db_manager.get_connection() as conn:
+                    with get_db_manager().get_connection() as conn:
                         cur = conn.cursor()
                         cur.execute("SELECT COUNT(*) as count FROM users")
                         total = cur.fetchone()['count']
@@ -137,7 +135,7 @@ class AdminHandlers:
         """Show database information."""
         query = update.callback_query
         try:
-            info = db_manager.get_database_info()
+            info = get_db_manager().get_database_info()
             
             # Format database info
             db_info = f"🗄️ <b>Database Information</b>\n\n"
@@ -366,7 +364,7 @@ class AdminHandlers:
                     title = context.user_data['book_data']['title']
                     author = context.user_data['book_data']['author']
                     
-                    with db_manager.get_connection() as conn:
+                    with get_db_manager().get_connection() as conn:
                         cur = conn.cursor()
                         cur.execute("""
                             INSERT INTO books (title, author, total_pages, is_featured, created_by)
@@ -420,7 +418,7 @@ class AdminHandlers:
         try:
             search_term = update.message.text.strip()
             
-            with db_manager.get_connection() as conn:
+            with get_db_manager().get_connection() as conn:
                 cur = conn.cursor()
                 cur.execute("""
                     SELECT user_id, full_name, city, registration_date
@@ -456,7 +454,7 @@ class AdminHandlers:
         try:
             user_id = int(update.message.text.strip())
             
-            with db_manager.get_connection() as conn:
+            with get_db_manager().get_connection() as conn:
                 cur = conn.cursor()
                 cur.execute("UPDATE users SET is_banned = TRUE WHERE user_id = %s", (user_id,))
                 conn.commit()
@@ -477,7 +475,7 @@ class AdminHandlers:
         try:
             user_id = int(update.message.text.strip())
             
-            with db_manager.get_connection() as conn:
+            with get_db_manager().get_connection() as conn:
                 cur = conn.cursor()
                 cur.execute("UPDATE users SET is_banned = FALSE WHERE user_id = %s", (user_id,))
                 conn.commit()
@@ -513,7 +511,7 @@ class AdminHandlers:
                 # Get all user IDs
                 user_ids = []
                 try:
-                    with db_manager.get_connection() as conn:
+                    with get_db_manager().get_connection() as conn:
                         cur = conn.cursor()
                         cur.execute("SELECT user_id FROM users")
                         rows = cur.fetchall()
@@ -574,7 +572,7 @@ class AdminHandlers:
             users_per_page = 10
             offset = page * users_per_page
             
-            with db_manager.get_connection() as conn:
+            with get_db_manager().get_connection() as conn:
                 cur = conn.cursor()
                 # Get total count
                 cur.execute("SELECT COUNT(*) as count FROM users")
@@ -711,7 +709,7 @@ class AdminHandlers:
             books_per_page = 10
             offset = page * books_per_page
             
-            with db_manager.get_connection() as conn:
+            with get_db_manager().get_connection() as conn:
                 cur = conn.cursor()
                 # Get total count
                 # Get total count
@@ -798,7 +796,7 @@ class AdminHandlers:
     async def _show_all_users(self, query):
         """Show all users in the system."""
         try:
-            with db_manager.get_connection() as conn:
+            with get_db_manager().get_connection() as conn:
                 cur = conn.cursor()
                 cur.execute("SELECT user_id, full_name, nickname, city, contact, registration_date FROM users ORDER BY registration_date DESC LIMIT 20")
                 users = cur.fetchall()
@@ -830,7 +828,7 @@ class AdminHandlers:
     async def _show_user_statistics(self, query):
         """Show user statistics."""
         try:
-            with db_manager.get_connection() as conn:
+            with get_db_manager().get_connection() as conn:
                 cur = conn.cursor()
                 
                 # Total users
@@ -878,7 +876,7 @@ class AdminHandlers:
     async def _show_league_analytics(self, query):
         """Show league analytics."""
         try:
-            with db_manager.get_connection() as conn:
+            with get_db_manager().get_connection() as conn:
                 cur = conn.cursor()
                 
                 # Total leagues
@@ -933,7 +931,7 @@ class AdminHandlers:
     async def _show_reading_analytics(self, query):
         """Show reading analytics."""
         try:
-            with db_manager.get_connection() as conn:
+            with get_db_manager().get_connection() as conn:
                 cur = conn.cursor()
                 
                 # Total reading sessions
@@ -991,7 +989,7 @@ class AdminHandlers:
     async def _show_system_health(self, query):
         """Show system health metrics."""
         try:
-            with db_manager.get_connection() as conn:
+            with get_db_manager().get_connection() as conn:
                 cur = conn.cursor()
                 
                 # Database size
@@ -116,14 +116,14 @@ class AdminLeagueHandlers:
     async def _show_available_books_for_league(self, update: Update, context: ContextTypes.DEFAULT_TYPE, page: int = 0) -> None:
         """Show available books as inline keyboard options for league creation."""
         try:
-            from src.database.database import db_manager
+            from src.database.database import get_db_manager
             from telegram import InlineKeyboardButton, InlineKeyboardMarkup
             
             # Get all available books from database
             books_per_page = 5
             offset = page * books_per_page
             
-            with db_manager.get_connection() as conn:
+            with get_db_manager().get_connection() as conn:
                 cur = conn.cursor()
                 # Get total count
                 cur.execute("SELECT COUNT(*) as count FROM books")
@@ -220,8 +220,8 @@ class AdminLeagueHandlers:
                 book_id = int(query.data.split("_")[-1])
                 
                 # Get book details
-                from src.database.database import db_manager
-                with db_manager.get_connection() as conn:
+                from src.database.database import get_db_manager
+                with get_db_manager().get_connection() as conn:
                     cur = conn.cursor()
                     cur.execute("""
                         SELECT book_id, title, author, total_pages 
@@ -574,16 +574,16 @@ class AdminLeagueHandlers:
             if not league or league.admin_id != update.effective_user.id:
                 await update.message.reply_text("❌ Not allowed")
                 return
-            rows = self.league_service.league_repo.export_league_rows(lid)
-            if not rows:
+            columns = self.league_service.league_repo.export_league_columns(lid)
+            if not columns["full_name"]:
                 await update.message.reply_text("No data to export.")
                 return
             # Simple CSV inline
             import csv
             from io import StringIO
             buf = StringIO()
-            writer = csv.DictWriter(buf, fieldnames=list(rows[0].keys()))
-            writer.writeheader(); writer.writerows(rows)
+            writer = csv.writer(buf)
+            writer.writerow(columns.keys()); writer.writerows(zip(*columns.values()))
             buf.seek(0)
             await update.message.reply_document(document=buf.getvalue().encode('utf-8'), filename=f"league_{lid}_export.csv")
         except Exception as e:
@@ -76,7 +76,7 @@ class LeagueHandlers:
             user_id = update.effective_user.id
             
             # Get available leagues
-            available_leagues = self.league_service.get_available_leagues(user_id)
+            available_leagues = self.league_service.get_available_leagues_with_counts(user_id)
             
             if not available_leagues:
                 await update.callback_query.edit_message_text(
@@ -88,10 +88,7 @@ class LeagueHandlers:
             
             # Prepare league data for display
             league_data = []
-            for league in available_leagues:
-                member_count = self.league_service.league_repo.get_league_member_count(
-                    league.league_id
-                )
+            for league, member_count in available_leagues:
                 league_data.append({
                     'league_id': league.league_id,
                     'name': league.name,
@@ -261,8 +258,9 @@ class LeagueHandlers:
             query = update.callback_query
             user_id = update.effective_user.id
             
-            # Get user's leagues
-            user_leagues = self.league_service.get_user_leagues(user_id)
+            # Get user's leagues together with their member counts
+            leagues_with_counts = self.league_service.get_user_leagues_with_counts(user_id)
+            user_leagues = [league for league, _ in leagues_with_counts]
             
             if not user_leagues:
                 await query.edit_message_text(
@@ -274,10 +272,7 @@ class LeagueHandlers:
             
             # Format leagues list
             message = "🏆 <b>Your Leagues:</b>\n\n"
-            for league in user_leagues:
-                member_count = self.league_service.league_repo.get_league_member_count(
-                    league.league_id
-                )
+            for league, member_count in leagues_with_counts:
                 message += (
                     f"📚 <b>{league.name}</b>\n"
                     f"   👥 Members: {member_count}/{league.max_members}\n"
@@ -314,7 +309,7 @@ class LeagueHandlers:
                 await update.message.reply_text("You are not in any leagues. Use /league to join one.")
                 return
             league = leagues[0]
-            text = self._format_leaderboard(league.league_id, league.name)
+            text = await self._format_leaderboard(league.league_id, league.name)
             await update.message.reply_text(text)
         elif update.callback_query:
             query = update.callback_query
@@ -326,7 +321,7 @@ class LeagueHandlers:
                 await query.edit_message_text("You are not in any leagues. Use /league to join one.")
                 return
             league = leagues[0]
-            text = self._format_leaderboard(league.league_id, league.name)
+            text = await self._format_leaderboard(league.league_id, league.name)
             await query.edit_message_text(text)
 
     async def handle_leaderboard_view(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -338,7 +333,7 @@ class LeagueHandlers:
         if not league:
             await query.edit_message_text("❌ League not found.")
             return
-        text = self._format_leaderboard(league_id, league.name)
+        text = await self._format_leaderboard(league_id, league.name)
         await query.edit_message_text(text)
 
     def _format_league_details(self, league_info: Dict[str, Any]) -> str:
@@ -390,8 +385,8 @@ class LeagueHandlers:
         
         return InlineKeyboardMarkup(keyboard)
 
-    def _format_leaderboard(self, league_id: int, league_name: str) -> str:
-        lb = self.league_service.get_league_leaderboard(league_id)
+    async def _format_leaderboard(self, league_id: int, league_name: str) -> str:
+        lb = await self.league_service.get_league_leaderboard(league_id)
         if not lb:
             return f"🏆 Leaderboard for {league_name}\n\nNo progress yet. Be the first to read!"
         lines: List[str] = [f"🏆 Leaderboard for {league_name}", ""]
@@ -442,7 +437,7 @@ class LeagueHandlers:
         
         # Show leaderboard for the first league (or let user choose)
         league = user_leagues[0]
-        text = self._format_leaderboard(league.league_id, league.name)
+        text = await self._format_leaderboard(league.league_id, league.name)
         
         keyboard = InlineKeyboardMarkup([[
             InlineKeyboardButton("🔙 Back to League Menu", callback_data="league_main_menu")
@@ -465,7 +460,7 @@ class LeagueHandlers:
                 return
             
             # Get leaderboard for stats
-            leaderboard = self.league_service.get_league_leaderboard(league_id)
+            leaderboard = await self.league_service.get_league_leaderboard(league_id)
             
             # Format stats message
             message = f"📊 <b>League Statistics: {league.name}</b>\n\n"
@@ -508,7 +503,7 @@ class LeagueHandlers:
                 return
             
             # Get members (using leaderboard logic to show progress)
-            leaderboard = self.league_service.get_league_leaderboard(league_id)
+            leaderboard = await self.league_service.get_league_leaderboard(league_id)
             
             message = f"👥 <b>Members of {league.name}</b>\n\n"
             
@@ -6,15 +6,13 @@ This module contains all the user command handlers for the bot.
 
 import asyncio
 import logging
-from telegram import Update, InlineKeyboardMarkup, InlineKeyboardButton
+from telegram import Update, Message, User, InlineKeyboardMarkup, InlineKeyboardButton
 from telegram.ext import ContextTypes
 
-from src.config.messages import HELP_MESSAGE, WELCOME_MESSAGE, MODE_SELECTION_MESSAGE, REGISTRATION_MESSAGE, PROGRESS_UPDATE_MESSAGE
-from src.services.factory import get_league_service
+from src.config.messages import HELP_MESSAGE, WELCOME_MESSAGE, MODE_SELECTION_MESSAGE, REGISTRATION_MESSAGE, PROGRESS_UPDATE_MESSAGE, STATS_SUMMARY_MESSAGE
+from src.services.factory import get_league_service, get_book_service, get_reminder_service
 from src.core.handlers.league_handlers import LeagueHandlers
-from src.services.book_service import BookService
-from src.services.reminder_service import ReminderService
-from src.database.database import db_manager
+from src.database.database import get_db_manager
 
 
 class UserHandlers:
@@ -26,8 +24,12 @@ class UserHandlers:
         """Initialize user handlers."""
         self.logger = logging.getLogger(__name__)
         self._league_handlers = None
-        self.book_service = BookService()
-        self.reminder_service = ReminderService()
+        self.book_service = get_book_service()
+        self.reminder_service = get_reminder_service()
+        self._mode_dispatch = {
+            'mode_individual': self._enter_individual_mode,
+            'mode_community': self._enter_community_mode,
+        }
     
     @property
     def league_handlers(self) -> LeagueHandlers:
@@ -41,7 +43,7 @@ class UserHandlers:
         full_name_db = None
         nickname_db = None
         try:
-            with db_manager.get_connection() as conn:
+            with get_db_manager().get_connection() as conn:
                 cur = conn.cursor()
                 cur.execute("SELECT full_name, nickname FROM users WHERE user_id = %s", (user_id,))
                 row = cur.fetchone()
@@ -213,10 +215,7 @@ class UserHandlers:
             context.user_data.pop('awaiting_goal_custom', None)
             await update.message.reply_text(f"✅ Daily goal set to {val} pages/day.")
             # Show individual menu next
-            class Dummy: pass
-            d = Dummy(); d.edit_message_text = update.message.reply_text  # type: ignore
-            d.from_user = update.effective_user  # type: ignore
-            await self._show_individual_menu(d)
+            await self._individual_menu_impl(update.message.reply_text, update.effective_user.id)
             return
         
         # Registration flow
@@ -245,7 +244,7 @@ class UserHandlers:
                 await update.message.reply_text("Please enter a valid phone number.")
                 return
             try:
-                with db_manager.get_connection() as conn:
+                with get_db_manager().get_connection() as conn:
                     cur = conn.cursor()
                     cur.execute(
                         """
@@ -275,18 +274,22 @@ class UserHandlers:
     async def handle_mode_callback(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         query = update.callback_query
         await query.answer()
-        mode = query.data.split('_')[-1]
-        if mode == 'individual':
-            # Clear community mode context
-            context.user_data.pop('current_league_id', None)
-            context.user_data.pop('community_mode', None)
-            await self._show_individual_menu(query)
-        else:
-            # Set community mode context
-            context.user_data['community_mode'] = True
-            # Preserve league context - don't clear current_league_id
-            # This allows users to maintain their league context when navigating
-            await self._show_community_menu(query)
+        handler = self._mode_dispatch.get(query.data)
+        if handler:
+            await handler(query, context)
+    
+    async def _enter_individual_mode(self, query, context):
+        # Clear community mode context
+        context.user_data.pop('current_league_id', None)
+        context.user_data.pop('community_mode', None)
+        await self._show_individual_menu(query)
+    
+    async def _enter_community_mode(self, query, context):
+        # Set community mode context
+        context.user_data['community_mode'] = True
+        # Preserve league context - don't clear current_league_id
+        # This allows users to maintain their league context when navigating
+        await self._show_community_menu(query)
     
     async def _show_mode_menu(self, update: Update):
         # Import the global keyboard from bot.py
@@ -311,14 +314,18 @@ class UserHandlers:
             await update.message.reply_text(MODE_SELECTION_MESSAGE, reply_markup=GLOBAL_MODE_KEYBOARD, parse_mode='HTML')
     
     async def _show_individual_menu(self, query):
-        goal = self.book_service.get_user_daily_goal(query.from_user.id)
+        await self._individual_menu_impl(query.edit_message_text, query.from_user.id)
+    
+    async def _individual_menu_impl(self, send, user_id: int):
+        """Render the individual menu through ``send`` (edit or reply)."""
+        goal = self.book_service.get_user_daily_goal(user_id)
         keyboard = InlineKeyboardMarkup([
             [InlineKeyboardButton("📚 Books", callback_data="ind_books_menu"), InlineKeyboardButton("➕ Add My Book", callback_data="ind_add_book")],
             [InlineKeyboardButton("📖 Update Progress", callback_data="ind_progress")],
             [InlineKeyboardButton(f"🎯 Daily Goal: {goal}p", callback_data="ind_set_goal"), InlineKeyboardButton("⏰ Reminders", callback_data="ind_reminder")],
             [InlineKeyboardButton("📊 Stats & Achievements", callback_data="achievement_menu")],
         ])
-        await query.edit_message_text("Individual Mode — choose an option:", reply_markup=keyboard)
+        await send("Individual Mode — choose an option:", reply_markup=keyboard)
     
     async def _show_books_menu(self, query):
         """Show books submenu with My Books and Featured Books options."""
@@ -412,14 +419,9 @@ class UserHandlers:
             await q.edit_message_text("📘 What's the book title?")
         elif action == 'ind_progress':
             await q.edit_message_text("📖 Update your reading progress:")
-            class Dummy: pass
-            d = Dummy(); d.message = q.message  # type: ignore
-            d.effective_user = q.from_user  # type: ignore
-            await self.progress_command(d, context)
+            await self._progress_impl(q.message, q.from_user, context)
         elif action == 'ind_reminder':
-            class Dummy: pass
-            d = Dummy(); d.message = q.message  # type: ignore
-            await self.reminder_command(d, context)
+            await self._reminder_impl(q.message, context)
         elif action == 'ind_set_goal':
             goal = self.book_service.get_user_daily_goal(q.from_user.id)
             kb = InlineKeyboardMarkup([
@@ -527,8 +529,8 @@ class UserHandlers:
                 success = self.book_service.start_reading(user_id, league.current_book_id)
                 if success:
                     # Get the book details from database
-                    from src.database.database import db_manager
-                    with db_manager.get_connection() as conn:
+                    from src.database.database import get_db_manager
+                    with get_db_manager().get_connection() as conn:
                         cur = conn.cursor()
                         cur.execute(
                             "SELECT title, author, total_pages FROM books WHERE book_id = %s",
@@ -844,7 +846,7 @@ class UserHandlers:
             
             for league in user_leagues:
                 # Get league leaderboard
-                leaderboard = self.league_handlers.league_service.get_league_leaderboard(league.league_id)
+                leaderboard = await self.league_handlers.league_service.get_league_leaderboard(league.league_id)
                 
                 text += f"<b>🏆 {league.name}</b>\n"
                 text += f"   Status: {league.status}\n"
@@ -909,9 +911,12 @@ class UserHandlers:
         await update.message.reply_text(HELP_MESSAGE, reply_markup=GLOBAL_MODE_KEYBOARD)
     
     async def books_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        await self._books_impl(update.message, context)
+    
+    async def _books_impl(self, message: Message, context: ContextTypes.DEFAULT_TYPE):
         books = self.book_service.get_featured_books()
         if not books:
-            await update.message.reply_text("No featured books available right now.")
+            await message.reply_text("No featured books available right now.")
             return
         keyboard = []
         for b in books:
@@ -922,13 +927,15 @@ class UserHandlers:
                 )
             ])
         reply_markup = InlineKeyboardMarkup(keyboard)
-        await update.message.reply_text("📚 Featured Books (tap to start):", reply_markup=reply_markup)
+        await message.reply_text("📚 Featured Books (tap to start):", reply_markup=reply_markup)
     
     async def progress_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        user_id = update.effective_user.id
-        active = self.book_service.get_active_books(user_id)
+        await self._progress_impl(update.message, update.effective_user, context)
+    
+    async def _progress_impl(self, message: Message, user: User, context: ContextTypes.DEFAULT_TYPE):
+        active = self.book_service.get_active_books(user.id)
         if not active:
-            await update.message.reply_text("You have no active books. Use /books to start one.")
+            await message.reply_text("You have no active books. Use /books to start one.")
             return
 
         # Always show list of books for selection as per improved UX flow
@@ -944,29 +951,28 @@ class UserHandlers:
         # Add back button
         keyboard.append([InlineKeyboardButton("🏠 Individual Menu", callback_data="mode_individual")])
         
-        await update.message.reply_text("Select a book to update progress:", reply_markup=InlineKeyboardMarkup(keyboard))
+        await message.reply_text("Select a book to update progress:", reply_markup=InlineKeyboardMarkup(keyboard))
     
     async def stats_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        user_id = update.effective_user.id
-        stats = self.book_service.get_user_stats(user_id)
-        msg = (
-            "📊 Your Stats\n\n"
-            f"📚 Books Started: {stats['total_books']}\n"
-            f"🏁 Books Completed: {stats['completed_books']}\n"
-            f"📖 Total Pages Read: {stats['total_pages']}\n"
-        )
-        await update.message.reply_text(msg)
+        await self._stats_impl(update.message, update.effective_user, context)
+    
+    async def _stats_impl(self, message: Message, user: User, context: ContextTypes.DEFAULT_TYPE):
+        stats = self.book_service.get_user_stats(user.id)
+        await message.reply_text(STATS_SUMMARY_MESSAGE.format_map(stats))
     
     async def league_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         await self.league_handlers.handle_league_menu(update, context)
     
     async def reminder_command(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Show reminder inline menu with common times and options"""
+        await self._reminder_impl(update.message, context)
+    
+    async def _reminder_impl(self, message: Message, context: ContextTypes.DEFAULT_TYPE):
         kb = InlineKeyboardMarkup([
             [InlineKeyboardButton("8:00 PM", callback_data="rem_time_2000"), InlineKeyboardButton("9:00 PM", callback_data="rem_time_2100"), InlineKeyboardButton("9:30 PM", callback_data="rem_time_2130")],
             [InlineKeyboardButton("Custom Time", callback_data="rem_custom"), InlineKeyboardButton("Disable", callback_data="rem_disable")],
         ])
-        await update.message.reply_text("Reminders — choose a time", reply_markup=kb)
+        await message.reply_text("Reminders — choose a time", reply_markup=kb)
     
     async def handle_reminder_inline(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle inline reminder callbacks."""
@@ -974,7 +980,7 @@ class UserHandlers:
         await q.answer()
         data = q.data
         if data == 'rem_menu':
-            return await self.reminder_command(q, context)  # type: ignore
+            return await self._reminder_impl(q.message, context)
         if data.startswith('rem_time_'):
             hhmm = data.split('_')[-1]
             hh = hhmm[:2]; mm = hhmm[2:]
@@ -4,173 +4,94 @@ Database connection and setup with PostgreSQL support.
 This module handles database initialization and connection management for both SQLite and PostgreSQL.
 """
 
+import asyncio
 import sqlite3
 import logging
 import os
+import queue
+import re
+import threading
+import itertools
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Any
-from contextlib import contextmanager
+from contextlib import contextmanager, asynccontextmanager
 try:
     import psycopg2
-    from psycopg2.extras import RealDictCursor
+    import psycopg2.errors
+    import psycopg2.extensions
+    import psycopg2.pool
+    from psycopg2.extras import RealDictCursor, execute_batch, execute_values
     HAS_POSTGRES = True
 except ImportError:
     HAS_POSTGRES = False
+try:
+    import asyncpg
+    HAS_ASYNCPG = True
+except ImportError:
+    HAS_ASYNCPG = False
 
+from src.config.constants import DEFAULT_ACHIEVEMENTS, DEFAULT_FEATURED_BOOKS
 from src.config.settings import (
-    DB_TYPE, DB_HOST, DB_NAME, DB_USER, DB_PASSWORD, DB_PORT, SQLITE_DB_PATH
+    DB_TYPE, DB_DRIVER, DB_HOST, DB_NAME, DB_USER, DB_PASSWORD, DB_PORT, SQLITE_DB_PATH,
+    DB_POOL_MIN_SIZE, DB_POOL_MAX_SIZE, SQLITE_POOL_SIZE
 )
 
+logger = logging.getLogger(__name__)
 
-class SQLiteConnectionWrapper:
-    """Wrapper for SQLite connection to return wrapped cursors."""
-    
-    def __init__(self, connection):
-        self._conn = connection
-        
-    def __getattr__(self, name):
-        return getattr(self._conn, name)
-        
-    def cursor(self):
-        return SQLiteCursorWrapper(self._conn.cursor())
-    
-    def close(self):
-        self._conn.close()
-        
-    def commit(self):
-        self._conn.commit()
-    
-    def rollback(self):
-        self._conn.rollback()
+# Errors raised by the database drivers themselves
+DRIVER_ERRORS = (sqlite3.Error, psycopg2.Error) if HAS_POSTGRES else (sqlite3.Error,)
 
+# Per-connection SQLite tuning. journal_mode=WAL is persisted in the database
+# file itself, so it only needs to be set once per process.
+SQLITE_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=30000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    # Memory-map up to 256 MB so reads skip the read() syscall copy
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA foreign_keys=ON",
+)
+_sqlite_wal_enabled = False
 
-class SQLiteCursorWrapper:
-    """Wrapper for SQLite cursor to translate PostgreSQL style queries."""
-    
-    def __init__(self, cursor):
-        self._cursor = cursor
-    
-    def __getattr__(self, name):
-        return getattr(self._cursor, name)
-        
-    def execute(self, sql, parameters=None):
-        # Translate %s to ?
-        if isinstance(sql, str):
-            sql = sql.replace('%s', '?')
-            
-        if parameters is None:
-            return self._cursor.execute(sql)
-        else:
-            return self._cursor.execute(sql, parameters)
-            
-    def executemany(self, sql, parameters):
-        if isinstance(sql, str):
-            sql = sql.replace('%s', '?')
-        return self._cursor.executemany(sql, parameters)
+# Per-connection prepared statement cache; the bot issues well over the
+# default 128 distinct statements, which would otherwise thrash.
+SQLITE_CACHED_STATEMENTS = 512
+_SQLITE_DIR = os.path.dirname(SQLITE_DB_PATH)
 
+# Rows per round-trip for PostgreSQL server-side (stream_cursor) cursors
+STREAM_ITERSIZE = 2000
 
-class DatabaseManager:
-    """Manages database connections and initialization for both SQLite and Postgres."""
-    
-    def __init__(self):
-        """Initialize database manager."""
-        self.logger = logging.getLogger(__name__)
-        self.db_type = DB_TYPE
-        
-        if self.db_type == 'sqlite':
-            # Ensure database directory exists
-            Path(SQLITE_DB_PATH).parent.mkdir(parents=True, exist_ok=True)
-            self.logger.info(f"Using SQLite database at {SQLITE_DB_PATH}")
-        elif self.db_type == 'postgres':
-            if not HAS_POSTGRES:
-                self.logger.error("psycopg2 not installed. Falling back to SQLite.")
-                self.db_type = 'sqlite'
-            else:
-                self.logger.info(f"Using PostgreSQL database at {DB_HOST}:{DB_PORT}/{DB_NAME}")
-    
-    @contextmanager
-    def get_connection(self):
-        """Get a database connection context manager."""
-        conn = None
-        try:
-            if self.db_type == 'postgres':
-                # PostgreSQL Connection
-                if os.getenv('DATABASE_URL'):
-                    conn = psycopg2.connect(
-                        os.getenv('DATABASE_URL'),
-                        cursor_factory=RealDictCursor
-                    )
-                else:
-                    conn = psycopg2.connect(
-                        host=DB_HOST,
-                        database=DB_NAME,
-                        user=DB_USER,
-                        password=DB_PASSWORD,
-                        port=DB_PORT,
-                        cursor_factory=RealDictCursor
-                    )
-                yield conn
-            else:
-                # SQLite Connection
-                real_conn = sqlite3.connect(SQLITE_DB_PATH)
-                real_conn.row_factory = sqlite3.Row
-                
-                # Wrap connection properly
-                conn = SQLiteConnectionWrapper(real_conn)
-                
-                yield conn
-        except Exception as e:
-            self.logger.error(f"Failed to connect to database: {e}")
-            raise
-        finally:
-            if conn:
-                conn.close()
-
-    def init_database(self):
-        """Initialize database tables."""
-        try:
-            # For Postgres, we check connection first
-            if self.db_type == 'postgres':
-                try:
-                    with self.get_connection() as conn:
-                        pass
-                except Exception as e:
-                    self.logger.error(f"Could not connect to PostgreSQL. Please check credentials. Error: {e}")
-                    return
+# Bump whenever SCHEMA_SQL or _insert_default_data changes so existing
+# databases re-run initialization on the next startup.
+SCHEMA_VERSION = 7
 
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                
-                # Create tables
-                self._create_tables(cursor)
-                
-                # Insert default data
-                self._insert_default_data(cursor)
-                
-                conn.commit()
-                self.logger.info("Database initialized successfully")
-                
-        except Exception as e:
-            self.logger.error(f"Failed to initialize database: {e}")
-            raise
+# Dialect-specific column snippets used by the schema DDL
+DIALECT_TYPES = {
+    'sqlite': {
+        'auto_inc_pk': "INTEGER PRIMARY KEY AUTOINCREMENT",
+        'timestamp_default': "TIMESTAMP DEFAULT CURRENT_TIMESTAMP",
+        'boolean_true': "1",
+        'boolean_false': "0",
+        # Composite-key tables cluster on their primary key
+        'without_rowid': " WITHOUT ROWID",
+    },
+    'postgres': {
+        'auto_inc_pk': "SERIAL PRIMARY KEY",
+        'timestamp_default': "TIMESTAMP DEFAULT CURRENT_TIMESTAMP",
+        'boolean_true': "TRUE",
+        'boolean_false': "FALSE",
+        'without_rowid': "",
+    },
+}
 
-    def _create_tables(self, cursor: Any):
-        """Create all database tables with dialect-specific SQL."""
-        
-        # Dialect specific types
-        if self.db_type == 'postgres':
-            AUTO_INC_PK = "SERIAL PRIMARY KEY"
-            TIMESTAMP_DEFAULT = "TIMESTAMP DEFAULT CURRENT_TIMESTAMP"
-            BOOLEAN_TRUE = "TRUE"
-            BOOLEAN_FALSE = "FALSE"
-        else:
-            AUTO_INC_PK = "INTEGER PRIMARY KEY AUTOINCREMENT"
-            TIMESTAMP_DEFAULT = "TIMESTAMP DEFAULT CURRENT_TIMESTAMP"
-            BOOLEAN_TRUE = "1"
-            BOOLEAN_FALSE = "0"
 
-        # Users table
-        cursor.execute(f'''
+def _build_table_ddl(auto_inc_pk: str, timestamp_default: str, boolean_true: str, boolean_false: str,
+                     without_rowid: str) -> dict:
+    """Render the CREATE TABLE statements for one dialect."""
+    return {
+        'users': f'''
             CREATE TABLE IF NOT EXISTS users (
                 user_id BIGINT PRIMARY KEY, -- Telegram ID is big
                 full_name TEXT NOT NULL,
@@ -181,43 +102,39 @@ class DatabaseManager:
                 daily_goal INTEGER DEFAULT 20,
                 reminder_time TEXT,
                 reminder_frequency TEXT DEFAULT 'daily',
-                registration_date {TIMESTAMP_DEFAULT},
-                last_activity {TIMESTAMP_DEFAULT},
-                is_active BOOLEAN DEFAULT {BOOLEAN_TRUE},
-                is_admin BOOLEAN DEFAULT {BOOLEAN_FALSE},
-                is_banned BOOLEAN DEFAULT {BOOLEAN_FALSE},
+                registration_date {timestamp_default},
+                last_activity {timestamp_default},
+                is_active BOOLEAN DEFAULT {boolean_true},
+                is_admin BOOLEAN DEFAULT {boolean_false},
+                is_banned BOOLEAN DEFAULT {boolean_false},
                 bio TEXT,
                 reading_goal_pages_per_day INTEGER DEFAULT 20,
                 preferred_reading_time TEXT,
                 favorite_genres TEXT,
                 reading_level TEXT,
                 privacy_level TEXT DEFAULT 'public',
-                show_achievements BOOLEAN DEFAULT {BOOLEAN_TRUE},
-                show_reading_stats BOOLEAN DEFAULT {BOOLEAN_TRUE}
+                show_achievements BOOLEAN DEFAULT {boolean_true},
+                show_reading_stats BOOLEAN DEFAULT {boolean_true}
             )
-        ''')
-        
-        # Books table
-        cursor.execute(f'''
+        ''',
+        'books': f'''
             CREATE TABLE IF NOT EXISTS books (
-                book_id {AUTO_INC_PK},
+                book_id {auto_inc_pk},
                 title TEXT NOT NULL,
                 author TEXT NOT NULL,
                 total_pages INTEGER NOT NULL,
                 category TEXT,
                 description TEXT,
                 cover_image TEXT,
-                is_featured BOOLEAN DEFAULT {BOOLEAN_FALSE},
+                is_featured BOOLEAN DEFAULT {boolean_false},
                 created_by BIGINT,
-                created_at {TIMESTAMP_DEFAULT},
+                created_at {timestamp_default},
                 FOREIGN KEY (created_by) REFERENCES users (user_id)
             )
-        ''')
-        
-        # Leagues table
-        cursor.execute(f'''
+        ''',
+        'leagues': f'''
             CREATE TABLE IF NOT EXISTS leagues (
-                league_id {AUTO_INC_PK},
+                league_id {auto_inc_pk},
                 name TEXT NOT NULL,
                 description TEXT,
                 admin_id BIGINT NOT NULL,
@@ -228,35 +145,31 @@ class DatabaseManager:
                 daily_goal INTEGER DEFAULT 20,
                 max_members INTEGER DEFAULT 50,
                 status TEXT DEFAULT 'active',
-                created_at {TIMESTAMP_DEFAULT},
+                created_at {timestamp_default},
                 FOREIGN KEY (admin_id) REFERENCES users (user_id),
                 FOREIGN KEY (created_by) REFERENCES users (user_id),
                 FOREIGN KEY (current_book_id) REFERENCES books (book_id)
             )
-        ''')
-
-        # League members table
-        cursor.execute(f'''
+        ''',
+        'league_members': f'''
             CREATE TABLE IF NOT EXISTS league_members (
                 league_id INTEGER,
                 user_id BIGINT,
-                joined_at {TIMESTAMP_DEFAULT},
-                is_active BOOLEAN DEFAULT {BOOLEAN_TRUE},
+                joined_at {timestamp_default},
+                is_active BOOLEAN DEFAULT {boolean_true},
                 PRIMARY KEY (league_id, user_id),
                 FOREIGN KEY (league_id) REFERENCES leagues (league_id),
                 FOREIGN KEY (user_id) REFERENCES users (user_id)
-            )
-        ''')
-        
-        # User books table
-        cursor.execute(f'''
+            ){without_rowid}
+        ''',
+        'user_books': f'''
             CREATE TABLE IF NOT EXISTS user_books (
-                id {AUTO_INC_PK},
+                id {auto_inc_pk},
                 user_id BIGINT,
                 book_id INTEGER,
                 league_id INTEGER,
-                start_date {TIMESTAMP_DEFAULT},
-                last_updated {TIMESTAMP_DEFAULT},
+                start_date {timestamp_default},
+                last_updated {timestamp_default},
                 pages_read INTEGER DEFAULT 0,
                 status TEXT DEFAULT 'active',
                 target_completion_date DATE,
@@ -264,12 +177,10 @@ class DatabaseManager:
                 FOREIGN KEY (book_id) REFERENCES books (book_id),
                 FOREIGN KEY (league_id) REFERENCES leagues (league_id)
             )
-        ''')
-        
-        # Reading sessions table
-        cursor.execute(f'''
+        ''',
+        'reading_sessions': f'''
             CREATE TABLE IF NOT EXISTS reading_sessions (
-                id {AUTO_INC_PK},
+                id {auto_inc_pk},
                 user_id BIGINT,
                 book_id INTEGER,
                 league_id INTEGER,
@@ -277,30 +188,26 @@ class DatabaseManager:
                 pages_read INTEGER NOT NULL,
                 reading_time_minutes INTEGER,
                 notes TEXT,
-                timestamp {TIMESTAMP_DEFAULT},
+                timestamp {timestamp_default},
                 FOREIGN KEY (user_id) REFERENCES users (user_id),
                 FOREIGN KEY (book_id) REFERENCES books (book_id),
                 FOREIGN KEY (league_id) REFERENCES leagues (league_id)
             )
-        ''')
-        
-        # Achievements table
-        cursor.execute(f'''
+        ''',
+        'achievements': f'''
             CREATE TABLE IF NOT EXISTS achievements (
-                id {AUTO_INC_PK},
+                id {auto_inc_pk},
                 user_id BIGINT,
                 type TEXT NOT NULL,
                 title TEXT NOT NULL,
                 description TEXT,
-                earned_at {TIMESTAMP_DEFAULT},
+                earned_at {timestamp_default},
                 metadata TEXT,
-                is_notified BOOLEAN DEFAULT {BOOLEAN_FALSE},
+                is_notified BOOLEAN DEFAULT {boolean_false},
                 FOREIGN KEY (user_id) REFERENCES users (user_id)
             )
-        ''')
-        
-        # User statistics table
-        cursor.execute(f'''
+        ''',
+        'user_stats': f'''
             CREATE TABLE IF NOT EXISTS user_stats (
                 user_id BIGINT PRIMARY KEY,
                 current_streak INTEGER DEFAULT 0,
@@ -312,204 +219,821 @@ class DatabaseManager:
                 total_pages_read INTEGER DEFAULT 0,
                 last_reading_date DATE,
                 streak_start_date DATE,
-                created_at {TIMESTAMP_DEFAULT},
-                updated_at {TIMESTAMP_DEFAULT},
+                created_at {timestamp_default},
+                updated_at {timestamp_default},
                 FOREIGN KEY (user_id) REFERENCES users (user_id)
             )
-        ''')
-
-        # Motivation messages table
-        cursor.execute(f'''
+        ''',
+        'motivation_messages': f'''
             CREATE TABLE IF NOT EXISTS motivation_messages (
-                id {AUTO_INC_PK},
+                id {auto_inc_pk},
                 user_id BIGINT,
                 message_type TEXT NOT NULL,
                 content TEXT NOT NULL,
-                sent_at {TIMESTAMP_DEFAULT},
-                is_read BOOLEAN DEFAULT {BOOLEAN_FALSE},
+                sent_at {timestamp_default},
+                is_read BOOLEAN DEFAULT {boolean_false},
                 metadata TEXT,
                 FOREIGN KEY (user_id) REFERENCES users (user_id)
             )
-        ''')
-        
-        # Visual elements table
-        cursor.execute(f'''
+        ''',
+        'visual_elements': f'''
             CREATE TABLE IF NOT EXISTS visual_elements (
-                id {AUTO_INC_PK},
+                id {auto_inc_pk},
                 user_id BIGINT,
                 element_type TEXT NOT NULL,
                 data TEXT NOT NULL,
-                created_at {TIMESTAMP_DEFAULT},
+                created_at {timestamp_default},
                 expires_at TIMESTAMP,
-                is_active BOOLEAN DEFAULT {BOOLEAN_TRUE},
+                is_active BOOLEAN DEFAULT {boolean_true},
                 FOREIGN KEY (user_id) REFERENCES users (user_id)
             )
-        ''')
-        
-        # Achievement definitions table
-        cursor.execute(f'''
+        ''',
+        'achievement_definitions': f'''
             CREATE TABLE IF NOT EXISTS achievement_definitions (
-                id {AUTO_INC_PK},
+                id {auto_inc_pk},
                 type TEXT UNIQUE NOT NULL,
                 title TEXT NOT NULL,
                 description TEXT NOT NULL,
                 icon TEXT,
                 xp_reward INTEGER DEFAULT 0,
-                is_active BOOLEAN DEFAULT {BOOLEAN_TRUE},
-                created_at {TIMESTAMP_DEFAULT}
+                is_active BOOLEAN DEFAULT {boolean_true},
+                created_at {timestamp_default}
             )
-        ''')
-        
-        # Reminders table
-        cursor.execute(f'''
+        ''',
+        'reminders': f'''
             CREATE TABLE IF NOT EXISTS reminders (
-                id {AUTO_INC_PK},
+                id {auto_inc_pk},
                 user_id BIGINT,
                 reminder_time TIME NOT NULL,
                 frequency TEXT DEFAULT 'daily',
-                is_active BOOLEAN DEFAULT {BOOLEAN_TRUE},
+                is_active BOOLEAN DEFAULT {boolean_true},
                 last_sent TIMESTAMP,
-                created_at {TIMESTAMP_DEFAULT},
+                created_at {timestamp_default},
                 FOREIGN KEY (user_id) REFERENCES users (user_id)
             )
-        ''')
-        
-        # Indexes (Syntax is mostly compatible)
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_user_books_user ON user_books(user_id)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_reading_sessions_user_date ON reading_sessions(user_id, session_date)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_league_members_league ON league_members(league_id)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_achievements_user ON achievements(user_id)')
-        cursor.execute('CREATE INDEX IF NOT EXISTS idx_user_stats_user ON user_stats(user_id)')
+        ''',
+    }
 
 
-    def _insert_default_data(self, cursor: Any):
-        """Insert default data into the database."""
-        from src.config.constants import DEFAULT_FEATURED_BOOKS
-        
-        # Postgres ON CONFLICT syntax differs from SQLite INSERT OR IGNORE
-        if self.db_type == 'postgres':
-            insert_book_sql = '''
-                INSERT INTO books (title, author, total_pages, category, description, is_featured)
-                VALUES (%s, %s, %s, %s, %s, TRUE)
-                ON CONFLICT DO NOTHING
-            '''
-            insert_ach_sql = '''
-                INSERT INTO achievement_definitions (type, title, description, icon, xp_reward)
-                VALUES (%s, %s, %s, %s, %s)
-                ON CONFLICT (type) DO NOTHING
-            '''
-            placeholders = ("%s", "%s", "%s", "%s", "%s") # Not used directly but conceptual
-        else:
-            insert_book_sql = '''
-                INSERT OR IGNORE INTO books (title, author, total_pages, category, description, is_featured)
-                VALUES (?, ?, ?, ?, ?, 1)
-            '''
-            insert_ach_sql = '''
-                INSERT OR IGNORE INTO achievement_definitions (type, title, description, icon, xp_reward)
-                VALUES (?, ?, ?, ?, ?)
-            '''
-            
-        # Insert default featured books
-        for book in DEFAULT_FEATURED_BOOKS:
-            cursor.execute(insert_book_sql, (
-                book['title'], book['author'], book['total_pages'], book['category'], book['description']
-            ))
+# Fully rendered CREATE TABLE statements per dialect, built once at import
+TABLE_DDL = {dialect: _build_table_ddl(**types) for dialect, types in DIALECT_TYPES.items()}
+
+# Indexes (syntax is compatible across both dialects)
+INDEX_DDL = (
+    'CREATE INDEX IF NOT EXISTS idx_user_books_user ON user_books(user_id)',
+    # Covers the per-user daily SUM(pages_read) without touching the table
+    'CREATE INDEX IF NOT EXISTS idx_reading_sessions_user_date_pages ON reading_sessions(user_id, session_date, pages_read)',
+    # Active-member counts and membership probes are answered from the index alone
+    'CREATE INDEX IF NOT EXISTS idx_league_members_league_active ON league_members(league_id, is_active, user_id)',
+    'CREATE INDEX IF NOT EXISTS idx_league_members_user ON league_members(user_id)',
+    'CREATE INDEX IF NOT EXISTS idx_user_books_league ON user_books(league_id, user_id)',
+    'CREATE INDEX IF NOT EXISTS idx_reading_sessions_book ON reading_sessions(book_id)',
+    'CREATE INDEX IF NOT EXISTS idx_achievements_user ON achievements(user_id)',
+    'CREATE INDEX IF NOT EXISTS idx_user_stats_user ON user_stats(user_id)',
+    # Covers per-league, per-date page totals grouped by user
+    'CREATE INDEX IF NOT EXISTS idx_reading_sessions_league_cover ON reading_sessions(league_id, session_date, user_id, pages_read)',
+    'CREATE INDEX IF NOT EXISTS idx_user_books_user_status ON user_books(user_id, status)',
+    'CREATE INDEX IF NOT EXISTS idx_achievements_user_type ON achievements(user_id, type)',
+    # Recent achievements: WHERE user_id = ? ORDER BY earned_at DESC LIMIT n
+    'CREATE INDEX IF NOT EXISTS idx_achievements_user_earned ON achievements(user_id, earned_at)',
+    'CREATE INDEX IF NOT EXISTS idx_reminders_active_time ON reminders(is_active, reminder_time) WHERE is_active = TRUE',
+    # League lists: WHERE status = ? / admin_id = ? ORDER BY created_at DESC, read in index order
+    'CREATE INDEX IF NOT EXISTS idx_leagues_status_created ON leagues(status, created_at)',
+    'CREATE INDEX IF NOT EXISTS idx_leagues_admin_created ON leagues(admin_id, created_at)',
+)
+
+# Indexes superseded by the covering indexes above
+DROPPED_INDEX_DDL = (
+    'DROP INDEX IF EXISTS idx_reading_sessions_user_date',
+    'DROP INDEX IF EXISTS idx_sessions_league_date',
+    'DROP INDEX IF EXISTS idx_league_members_league',
+)
+
+
+def _compact_sql(sql: str) -> str:
+    """Strip ``--`` comments and collapse runs of whitespace.
+
+    Only safe for SQL whose string literals contain neither, like the DDL here.
+    """
+    return re.sub(r'\s+', ' ', re.sub(r'--[^\n]*', '', sql)).strip()
+
+
+# The whole schema (tables, indexes, then ANALYZE to refresh planner
+# statistics) as one compacted script per dialect, sent in one call
+SCHEMA_SQL = {
+    dialect: _compact_sql(';\n'.join((*ddl.values(), *DROPPED_INDEX_DDL, *INDEX_DDL, 'ANALYZE')) + ';')
+    for dialect, ddl in TABLE_DDL.items()
+}
+
+# Featured books seeded on first run, as insert-ready tuples
+DEFAULT_BOOK_ROWS = tuple(
+    (book['title'], book['author'], book['total_pages'], book['category'], book['description'])
+    for book in DEFAULT_FEATURED_BOOKS
+)
+
+# Seed statements. On PostgreSQL, execute_values expands the single
+# "VALUES %s" into a multi-row list; on SQLite, {rows} is rendered below. books has no natural unique key, so
+# titles already seeded are skipped explicitly.
+SEED_BOOKS_SQL = {
+    'postgres': '''
+        INSERT INTO books (title, author, total_pages, category, description, is_featured)
+        SELECT v.title, v.author, v.total_pages, v.category, v.description, TRUE
+        FROM (VALUES %s) AS v (title, author, total_pages, category, description)
+        WHERE NOT EXISTS (SELECT 1 FROM books b WHERE b.title = v.title AND b.author = v.author)
+    ''',
+    'sqlite': '''
+        INSERT INTO books (title, author, total_pages, category, description, is_featured)
+        SELECT v.column1, v.column2, v.column3, v.column4, v.column5, 1
+        FROM (VALUES {rows}) AS v
+        WHERE NOT EXISTS (SELECT 1 FROM books b WHERE b.title = v.column1 AND b.author = v.column2)
+    ''',
+}
+SEED_BOOKS_PG_TEMPLATE = "(%s, %s, %s, %s, %s)"
+SEED_ACHIEVEMENTS_SQL = {
+    'postgres': '''
+        INSERT INTO achievement_definitions (type, title, description, icon, xp_reward)
+        VALUES %s
+        ON CONFLICT (type) DO NOTHING
+    ''',
+    'sqlite': '''
+        INSERT OR IGNORE INTO achievement_definitions (type, title, description, icon, xp_reward)
+        VALUES {rows}
+    ''',
+}
+
+
+def _sqlite_seed_statements(template: str, rows, batch: int = 100) -> tuple:
+    """Render ``(sql, params)`` pairs inserting ``batch`` rows per statement.
+
+    100 rows of 5 columns stays under SQLite's default limit of 999 bound
+    parameters.
+    """
+    row_sql = '(' + ', '.join('?' * len(rows[0])) + ')'
+    statements = []
+    for start in range(0, len(rows), batch):
+        chunk = rows[start:start + batch]
+        sql = template.format(rows=', '.join([row_sql] * len(chunk)))
+        statements.append((sql, tuple(itertools.chain.from_iterable(chunk))))
+    return tuple(statements)
+
+
+# SQLite has no execute_values; seed with pre-rendered multi-row statements
+SQLITE_SEED_STATEMENTS = (
+    *_sqlite_seed_statements(SEED_BOOKS_SQL['sqlite'], DEFAULT_BOOK_ROWS),
+    *_sqlite_seed_statements(SEED_ACHIEVEMENTS_SQL['sqlite'], DEFAULT_ACHIEVEMENTS),
+)
+
+# Tables reported by get_database_info
+INFO_TABLES = (
+    'users', 'books', 'leagues', 'user_books', 'reading_sessions', 'achievements',
+    'user_stats', 'motivation_messages', 'visual_elements', 'achievement_definitions',
+)
+INFO_COUNT_SQL = " UNION ALL ".join(
+    f"SELECT '{table}' AS table_name, COUNT(*) AS row_count FROM {table}" for table in INFO_TABLES
+)
+INFO_ESTIMATE_SQL = """
+    SELECT relname AS table_name, reltuples::bigint AS row_count
+    FROM pg_class
+    WHERE relkind = 'r' AND relname = ANY(%s) AND pg_table_is_visible(oid)
+"""
+
+_PG_PLACEHOLDER_RE = re.compile(r'%s')
+
+
+def to_asyncpg_sql(sql: str) -> str:
+    """Rewrite psycopg2-style ``%s`` placeholders to asyncpg's ``$1, $2, ...``."""
+    counter = itertools.count(1)
+    return _PG_PLACEHOLDER_RE.sub(lambda _match: f"${next(counter)}", sql)
+
+
+# Memoized %s -> ? translations, keyed by the SQL text itself
+_PLACEHOLDER_CACHE_SIZE = 1024
+
+
+@lru_cache(maxsize=_PLACEHOLDER_CACHE_SIZE)
+def _translate_placeholders(sql):
+    """Translate PostgreSQL ``%s`` placeholders to SQLite ``?``."""
+    if not isinstance(sql, str):
+        return sql
+    return sql.replace('%s', '?') if '%s' in sql else sql
+
+
+class SQLiteConnectionWrapper:
+    """Wrapper for SQLite connection to return wrapped cursors."""
+    
+    def __init__(self, connection):
+        self._conn = connection
+        # Bind hot methods directly so calls skip __getattr__
+        self.close = connection.close
+        self.commit = connection.commit
+        self.rollback = connection.rollback
         
-        # Insert default achievement definitions
-        default_achievements = [
-            # Bronze Level (1-30 days)
-            ('1_day_streak', '🥉 First Step', 'Started your reading journey', '🥉', 10),
-            ('3_day_streak', '🥉 First Spark', 'You\'ve built your first streak 🔥 Keep going!', '🥉', 25),
-            ('7_day_streak', '🥉 One Week Reader', '1 full week of reading! Consistency pays off 🌱', '🥉', 50),
-            ('14_day_streak', '🥉 Two-Week Challenger', 'Two weeks strong! Building momentum', '🥉', 100),
-            ('21_day_streak', '🥉 Habit Builder', '21 days = new habit formed 💪', '🥉', 150),
-            ('30_day_streak', '🥉 One Month Champion', 'One month of consistent reading!', '🥉', 200),
-            # Silver Level (31-100 days)
-            ('50_day_streak', '🥈 Golden Streak', '50 days of dedication! Shining bright', '🥈', 400),
-            ('75_day_streak', '🥈 Dedicated Reader', '75 days! Your dedication is inspiring', '🥈', 600),
-            ('100_day_streak', '🥈 Century Club', '100 days! Welcome to the Century Club 🎉', '🥈', 1000),
-            # Gold Level (101-250 days)
-            ('150_day_streak', '🥇 Unstoppable', '150 days! You are truly unstoppable', '🥇', 1500),
-            ('200_day_streak', '🥇 Marathon Mind', '200 days! Your mind is a reading marathon', '🥇', 2000),
-            ('250_day_streak', '🥇 Knowledge Seeker', '250 days! A true seeker of knowledge', '🥇', 2500),
-            # Diamond Level (251+ days)
-            ('300_day_streak', '💎 Book Sage', '300 days! You are a true book sage', '💎', 3000),
-            ('365_day_streak', '💎 One-Year Legend', '365 days! You are a reading legend 👑', '💎', 5000),
-            # Book completion achievements
-            ('first_book', '📖 First Book', 'Complete your first book', '📖', 100),
-            ('5_books', '📚 Book Collector', 'Complete 5 books', '📚', 300),
-            ('10_books', '📚 Book Lover', 'Complete 10 books', '📚', 600),
-            ('25_books', '📚 Book Enthusiast', 'Complete 25 books', '📚', 1500),
-            ('50_books', '📚 Book Master', 'Complete 50 books', '📚', 3000),
-            # Page reading achievements
-            ('100_pages', '📄 Page Turner', 'Read 100 pages', '📄', 50),
-            ('500_pages', '📄 Page Reader', 'Read 500 pages', '📄', 200),
-            ('1000_pages', '📄 Page Devourer', 'Read 1000 pages', '📄', 500),
-            ('5000_pages', '📄 Page Master', 'Read 5000 pages', '📄', 2000),
-            # Reading style achievements
-            ('speed_reader', '⚡ Speed Reader', 'Read 50+ pages in a single day', '⚡', 100),
-            ('consistent_reader', '📅 Consistent Reader', 'Read every day for a week', '📅', 150),
-            ('marathon_reader', '🏃 Marathon Reader', 'Read 100+ pages in a single day', '🏃', 200),
-            # Community achievements
-            ('community_contributor', '🌟 Community Star', 'Participate in a reading league', '🌟', 100),
-            ('league_champion', '🏆 League Champion', 'Win a reading league', '🏆', 500),
-            # League-specific achievements
-            ('league_100_pages', '🏆 League 100 Pages', 'Read 100 pages in a league', '🏆', 20),
-            ('league_500_pages', '🏆 League 500 Pages', 'Read 500 pages in a league', '🏆', 100),
-            ('league_1000_pages', '🏆 League 1000 Pages', 'Read 1000 pages in a league', '🏆', 200),
-            ('league_2000_pages', '🏆 League 2000 Pages', 'Read 2000 pages in a league', '🏆', 400),
-            ('league_first_book', '📚 League First Book', 'Complete your first book in a league', '📚', 150),
-            ('league_weekly_leader', '👑 Weekly Leader', 'Top reader for a week in a league', '👑', 300),
-            ('league_monthly_champion', '🏆 Monthly Champion', 'Top reader for a month in a league', '🏆', 600),
-        ]
+    def __getattr__(self, name):
+        # Fallback for rarely used attributes
+        return getattr(self._conn, name)
         
-        for achievement_type, title, description, icon, xp_reward in default_achievements:
-            cursor.execute(insert_ach_sql, (achievement_type, title, description, icon, xp_reward))
+    def cursor(self, tuples: bool = False):
+        cursor = self._conn.cursor()
+        if tuples:
+            cursor.row_factory = None
+        return SQLiteCursorWrapper(cursor)
     
-    def backup_database(self, backup_path: str) -> bool:
-        """Create a backup of the database."""
-        if self.db_type == 'postgres':
-            self.logger.warning("PostgreSQL backup not implemented via file copy.")
-            return False
+    @property
+    def in_transaction(self):
+        return self._conn.in_transaction
+    
+    @property
+    def isolation_level(self):
+        return self._conn.isolation_level
+
+
+class SQLiteCursorWrapper:
+    """Wrapper for SQLite cursor to translate PostgreSQL style queries."""
+    
+    def __init__(self, cursor):
+        self._cursor = cursor
+        # Bind hot methods directly so calls skip __getattr__
+        self.fetchone = cursor.fetchone
+        self.fetchall = cursor.fetchall
+        self.fetchmany = cursor.fetchmany
+        self.close = cursor.close
+    
+    def __getattr__(self, name):
+        # Fallback for rarely used attributes
+        return getattr(self._cursor, name)
+    
+    def __iter__(self):
+        return iter(self._cursor)
+    
+    @property
+    def rowcount(self):
+        return self._cursor.rowcount
+    
+    @property
+    def lastrowid(self):
+        return self._cursor.lastrowid
+    
+    @property
+    def description(self):
+        return self._cursor.description
+    
+    @property
+    def arraysize(self):
+        return self._cursor.arraysize
+        
+    def execute(self, sql, parameters=None):
+        # Translate %s to ?
+        sql = _translate_placeholders(sql)
             
+        if parameters is None:
+            return self._cursor.execute(sql)
+        else:
+            return self._cursor.execute(sql, parameters)
+            
+    def executemany(self, sql, parameters):
+        return self._cursor.executemany(_translate_placeholders(sql), parameters)
+
+
+class _SqliteBackend:
+    """SQLite specifics: pooled file connections, PRAGMA-based versioning."""
+
+    name = 'sqlite'
+    # executescript() commits any pending transaction before running, so the
+    # script opens its own; seeding then joins it and init commits once.
+    # IMMEDIATE takes the write lock up front instead of upgrading mid-DDL.
+    schema_script = 'BEGIN IMMEDIATE;\n' + SCHEMA_SQL['sqlite']
+
+    def __init__(self):
+        # Separate pools for read-write and read-only (mode=ro) connections;
+        # under WAL, readers never wait on the writer.
+        self._pool = queue.LifoQueue(maxsize=SQLITE_POOL_SIZE)
+        self._read_pool = queue.LifoQueue(maxsize=SQLITE_POOL_SIZE)
+        self._readonly_supported = str(SQLITE_DB_PATH) != ':memory:'
+        # Ensure database directory exists
+        if _SQLITE_DIR and not os.path.isdir(_SQLITE_DIR):
+            os.makedirs(_SQLITE_DIR, exist_ok=True)
+        logger.info(f"Using SQLite database at {SQLITE_DB_PATH}")
+
+    def connect(self, readonly: bool = False):
+        """Return ``(connection, pool)`` taken from the matching pool."""
+        readonly = readonly and self._readonly_supported
+        pool = self._read_pool if readonly else self._pool
         try:
-            import shutil
-            shutil.copy2(SQLITE_DB_PATH, backup_path)
-            self.logger.info(f"Database backed up to {backup_path}")
+            return pool.get_nowait(), pool
+        except queue.Empty:
+            return self._new_connection(readonly), pool
+
+    def _new_connection(self, readonly: bool = False) -> SQLiteConnectionWrapper:
+        """Open and configure a new SQLite connection."""
+        # Pooled connections may be handed to a different thread than the
+        # one that opened them; the pool guarantees exclusive use.
+        if readonly:
+            uri = f"{Path(SQLITE_DB_PATH).resolve().as_uri()}?mode=ro"
+            real_conn = sqlite3.connect(
+                uri, uri=True, check_same_thread=False, cached_statements=SQLITE_CACHED_STATEMENTS
+            )
+        else:
+            real_conn = sqlite3.connect(
+                SQLITE_DB_PATH, check_same_thread=False, cached_statements=SQLITE_CACHED_STATEMENTS
+            )
+        real_conn.row_factory = sqlite3.Row
+        self._configure(real_conn, readonly)
+        return SQLiteConnectionWrapper(real_conn)
+
+    def _configure(self, conn: sqlite3.Connection, readonly: bool = False):
+        """Apply WAL journaling and per-connection PRAGMAs to a SQLite connection."""
+        global _sqlite_wal_enabled
+        if not readonly and not _sqlite_wal_enabled and self._readonly_supported:
+            conn.execute("PRAGMA journal_mode=WAL")
+            _sqlite_wal_enabled = True
+        for pragma in SQLITE_PRAGMAS:
+            conn.execute(pragma)
+
+    def release(self, conn, pool):
+        """Return a connection to its pool, discarding any uncommitted work."""
+        try:
+            conn.rollback()
+            pool.put_nowait(conn)
+        except (sqlite3.Error, queue.Full):
+            conn.close()
+
+    def close_all(self):
+        """Close every pooled connection.
+
+        Read-write connections run PRAGMA optimize first so statistics
+        gathered during their lifetime are persisted for the planner.
+        """
+        for pool in (self._pool, self._read_pool):
+            while True:
+                try:
+                    conn = pool.get_nowait()
+                except queue.Empty:
+                    break
+                if pool is self._pool:
+                    try:
+                        conn.cursor().execute("PRAGMA optimize")
+                    except sqlite3.Error as e:
+                        logger.warning(f"PRAGMA optimize failed: {e}")
+                conn.close()
+
+    def check_connection(self, manager: 'DatabaseManager') -> bool:
+        """SQLite opens (or creates) the file on demand."""
+        return True
+
+    def create_schema(self, cursor: Any):
+        """Create all tables and indexes in one script."""
+        cursor.executescript(self.schema_script)
+
+    def get_schema_version(self, conn: Any, cursor: Any) -> int:
+        """Return the stored schema version (0 for a fresh database)."""
+        cursor.execute("PRAGMA user_version")
+        return cursor.fetchone()[0]
+
+    def set_schema_version(self, cursor: Any):
+        """Record SCHEMA_VERSION as the current schema version."""
+        # PRAGMA values cannot be bound as parameters
+        cursor.execute(f"PRAGMA user_version = {int(SCHEMA_VERSION)}")
+
+    def insert_default_data(self, cursor: Any):
+        """Seed featured books and achievements."""
+        for sql, params in SQLITE_SEED_STATEMENTS:
+            cursor.execute(sql, params)
+
+    def execute_many(self, cursor: Any, sql: str, rows, page_size: int):
+        """Run one parameterized statement for every row."""
+        cursor.executemany(sql, rows)
+
+    def tuple_cursor(self, conn: Any):
+        """Return a cursor yielding plain tuples."""
+        return conn.cursor(tuples=True)
+
+    def stream_cursor(self, conn: Any, name: str):
+        """SQLite cursors already step through results lazily."""
+        return conn.cursor(tuples=True)
+
+    def optimize(self, manager: 'DatabaseManager'):
+        """Let SQLite refresh planner statistics (PRAGMA optimize)."""
+        try:
+            with manager.get_connection() as conn:
+                conn.cursor().execute("PRAGMA optimize")
+        except sqlite3.Error as e:
+            logger.warning(f"PRAGMA optimize failed: {e}")
+
+    def backup(self, manager: 'DatabaseManager', backup_path: str) -> bool:
+        """Copy the live database to ``backup_path`` with SQLite's online backup API.
+
+        Unlike a file copy this is consistent while writes (and an unmerged
+        WAL) are in flight.
+        """
+        try:
+            dst = sqlite3.connect(backup_path)
+            try:
+                with manager.get_connection(readonly=True) as src:
+                    src.backup(dst, pages=1000)
+            finally:
+                dst.close()
+            logger.info(f"Database backed up to {backup_path}")
             return True
         except Exception as e:
-            self.logger.error(f"Failed to backup database: {e}")
+            logger.error(f"Failed to backup database: {e}")
+            return False
+
+    def table_counts(self, cursor: Any, exact: bool) -> dict:
+        """Return exact row counts for every table in INFO_TABLES."""
+        cursor.execute(INFO_COUNT_SQL)
+        return dict(cursor.fetchall())
+
+    def storage_info(self, cursor: Any) -> dict:
+        """Return the database file path and size, read in one query."""
+        cursor.execute("SELECT page_count * page_size FROM pragma_page_count(), pragma_page_size()")
+        size_bytes = cursor.fetchone()[0]
+        return {
+            'database_path': str(SQLITE_DB_PATH),
+            'database_size_mb': round(size_bytes / (1024 * 1024), 2)
+        }
+
+
+class _PostgresBackend:
+    """PostgreSQL specifics via a lazily created psycopg2 pool."""
+
+    name = 'postgres'
+
+    def __init__(self):
+        self._pool = None
+        logger.info(f"Using PostgreSQL database at {DB_HOST}:{DB_PORT}/{DB_NAME}")
+
+    def connect(self, readonly: bool = False):
+        """Return ``(connection, pool)``; Postgres has a single pool."""
+        pool = self._get_pool()
+        return pool.getconn(), pool
+
+    def _get_pool(self):
+        """Create the PostgreSQL connection pool on first use."""
+        if self._pool is None:
+            if os.getenv('DATABASE_URL'):
+                self._pool = psycopg2.pool.ThreadedConnectionPool(
+                    DB_POOL_MIN_SIZE,
+                    DB_POOL_MAX_SIZE,
+                    os.getenv('DATABASE_URL'),
+                    cursor_factory=RealDictCursor
+                )
+            else:
+                self._pool = psycopg2.pool.ThreadedConnectionPool(
+                    DB_POOL_MIN_SIZE,
+                    DB_POOL_MAX_SIZE,
+                    host=DB_HOST,
+                    database=DB_NAME,
+                    user=DB_USER,
+                    password=DB_PASSWORD,
+                    port=DB_PORT,
+                    cursor_factory=RealDictCursor
+                )
+        return self._pool
+
+    def release(self, conn, pool):
+        """Return a connection to the pool."""
+        # putconn rolls back open transactions and drops broken connections
+        pool.putconn(conn, close=bool(conn.closed))
+
+    def close_all(self):
+        """Close every pooled connection."""
+        if self._pool is not None:
+            self._pool.closeall()
+            self._pool = None
+
+    def check_connection(self, manager: 'DatabaseManager') -> bool:
+        """Verify the server is reachable before running DDL."""
+        try:
+            with manager.get_connection():
+                pass
+        except Exception as e:
+            logger.error(f"Could not connect to PostgreSQL. Please check credentials. Error: {e}")
             return False
+        return True
+
+    def create_schema(self, cursor: Any):
+        """Create all tables and indexes in one round-trip."""
+        cursor.execute(SCHEMA_SQL['postgres'])
+
+    def get_schema_version(self, conn: Any, cursor: Any) -> int:
+        """Return the stored schema version (0 for a fresh database)."""
+        try:
+            cursor.execute("SELECT version FROM schema_migrations LIMIT 1")
+        except psycopg2.errors.UndefinedTable:
+            conn.rollback()
+            return 0
+        row = cursor.fetchone()
+        return row['version'] if row else 0
+
+    def set_schema_version(self, cursor: Any):
+        """Record SCHEMA_VERSION as the current schema version."""
+        cursor.execute("CREATE TABLE IF NOT EXISTS schema_migrations (version INTEGER NOT NULL)")
+        cursor.execute("DELETE FROM schema_migrations")
+        cursor.execute("INSERT INTO schema_migrations (version) VALUES (%s)", (SCHEMA_VERSION,))
+
+    def insert_default_data(self, cursor: Any):
+        """Seed featured books and achievements."""
+        execute_values(cursor, SEED_BOOKS_SQL['postgres'], DEFAULT_BOOK_ROWS,
+                       template=SEED_BOOKS_PG_TEMPLATE, page_size=100)
+        execute_values(cursor, SEED_ACHIEVEMENTS_SQL['postgres'], DEFAULT_ACHIEVEMENTS, page_size=100)
+
+    def execute_many(self, cursor: Any, sql: str, rows, page_size: int):
+        """Run one parameterized statement per row, ``page_size`` rows per round-trip."""
+        execute_batch(cursor, sql, rows, page_size=page_size)
+
+    def tuple_cursor(self, conn: Any):
+        """Return a cursor yielding plain tuples."""
+        return conn.cursor(cursor_factory=psycopg2.extensions.cursor)
+
+    def stream_cursor(self, conn: Any, name: str):
+        """Return a named (server-side) tuple cursor fetching STREAM_ITERSIZE rows per round-trip."""
+        cursor = conn.cursor(name=name, cursor_factory=psycopg2.extensions.cursor)
+        cursor.itersize = STREAM_ITERSIZE
+        return cursor
+
+    def optimize(self, manager: 'DatabaseManager'):
+        """PostgreSQL relies on autovacuum/autoanalyze instead."""
+
+    def backup(self, manager: 'DatabaseManager', backup_path: str) -> bool:
+        """File-level backups are not supported; use pg_dump."""
+        logger.warning("PostgreSQL backup not implemented via file copy.")
+        return False
+
+    def table_counts(self, cursor: Any, exact: bool) -> dict:
+        """Return row counts, preferring pg_class estimates unless ``exact``."""
+        if not exact:
+            cursor.execute(INFO_ESTIMATE_SQL, (list(INFO_TABLES),))
+            estimates = dict(cursor.fetchall())
+            # reltuples is -1 until a table has been vacuumed/analyzed
+            if len(estimates) == len(INFO_TABLES) and min(estimates.values()) >= 0:
+                return {table: estimates[table] for table in INFO_TABLES}
+        # Exact counts for every table in a single round-trip
+        cursor.execute(INFO_COUNT_SQL)
+        return dict(cursor.fetchall())
+
+    def storage_info(self, cursor: Any) -> dict:
+        """No file-level details for a server database."""
+        return {}
+
+
+class DatabaseManager:
+    """Manages database connections and initialization for both SQLite and Postgres.
+
+    Dialect-specific behaviour lives in a backend object chosen once here,
+    so the methods below never branch on ``db_type``.
+    """
+    
+    def __init__(self):
+        """Initialize database manager."""
+        self.db_type = DB_TYPE
+        self._apg_pool = None
+        self.use_asyncpg = False
+        # Cleared while a background initialization runs; other threads
+        # wait on it before touching the database.
+        self._ready = threading.Event()
+        self._ready.set()
+        self._init_thread = None
+        # Set when the background initializer fails; re-raised to callers
+        self._init_error = None
+        
+        if self.db_type == 'postgres' and not HAS_POSTGRES:
+            logger.error("psycopg2 not installed. Falling back to SQLite.")
+            self.db_type = 'sqlite'
+        
+        if self.db_type == 'postgres':
+            self._backend = _PostgresBackend()
+            if DB_DRIVER == 'asyncpg':
+                if HAS_ASYNCPG:
+                    self.use_asyncpg = True
+                else:
+                    logger.warning("asyncpg not installed. Using psycopg2 only.")
+        else:
+            self._backend = _SqliteBackend()
     
-    def get_database_info(self) -> dict:
-        """Get database information and statistics."""
+    @contextmanager
+    def get_connection(self, readonly: bool = False):
+        """Get a pooled database connection context manager.
+
+        Pass ``readonly=True`` for pure reads; on SQLite these are served from
+        a separate pool of read-only connections. Blocks while a background
+        initialization started by ``init_database_in_background`` is running.
+        """
+        if threading.current_thread() is not self._init_thread:
+            self.wait_until_ready()
+        try:
+            conn, pool = self._backend.connect(readonly)
+        except DRIVER_ERRORS as e:
+            logger.error("Failed to connect to database: %s", e)
+            raise
+        # Errors raised by the caller's block propagate untouched; the
+        # connection is still returned (rolled back) to its pool.
+        try:
+            yield conn
+        finally:
+            self._backend.release(conn, pool)
+
+    def close_all(self):
+        """Close every pooled connection (call on shutdown)."""
+        self._backend.close_all()
+
+    async def init_async_pool(self):
+        """Create the asyncpg pool when DB_DRIVER=asyncpg (no-op otherwise)."""
+        if not self.use_asyncpg or self._apg_pool is not None:
+            return
+        if os.getenv('DATABASE_URL'):
+            self._apg_pool = await asyncpg.create_pool(
+                dsn=os.getenv('DATABASE_URL'),
+                min_size=DB_POOL_MIN_SIZE,
+                max_size=DB_POOL_MAX_SIZE,
+                statement_cache_size=1024
+            )
+        else:
+            self._apg_pool = await asyncpg.create_pool(
+                host=DB_HOST,
+                database=DB_NAME,
+                user=DB_USER,
+                password=DB_PASSWORD,
+                port=int(DB_PORT),
+                min_size=DB_POOL_MIN_SIZE,
+                max_size=DB_POOL_MAX_SIZE,
+                statement_cache_size=1024
+            )
+        logger.info("asyncpg connection pool ready")
+
+    @asynccontextmanager
+    async def get_async_connection(self):
+        """Get an asyncpg connection context manager.
+
+        Queries must use ``$1``-style placeholders; see ``to_asyncpg_sql``.
+        """
+        if self._apg_pool is None:
+            raise RuntimeError("Async PostgreSQL pool is not initialized (requires DB_DRIVER=asyncpg)")
+        async with self._apg_pool.acquire() as conn:
+            yield conn
+
+    async def close_async_pool(self):
+        """Close the asyncpg pool if one was created."""
+        if self._apg_pool is not None:
+            await self._apg_pool.close()
+            self._apg_pool = None
+
+    async def fetch_all_async(self, sql: str, params=()):
+        """Run a read query from a coroutine without blocking the event loop.
+
+        Uses the asyncpg pool when it is open; otherwise the query runs on a
+        read-only pooled connection in a worker thread. Rows support lookup
+        by column name on every backend.
+        """
+        if self._apg_pool is not None:
+            async with self.get_async_connection() as conn:
+                return await conn.fetch(to_asyncpg_sql(sql), *params)
+        return await asyncio.to_thread(self._fetch_all, sql, params)
+
+    def _fetch_all(self, sql: str, params):
+        with self.get_connection(readonly=True) as conn:
+            cur = conn.cursor()
+            cur.execute(sql, params)
+            return cur.fetchall()
+
+    def bulk_write(self, sql: str, rows, page_size: int = 200):
+        """Execute one parameterized write for many rows and commit.
+
+        Uses psycopg2's execute_batch on PostgreSQL (one round-trip per
+        ``page_size`` rows) and executemany on SQLite.
+        """
+        with self.get_connection() as conn:
+            self._backend.execute_many(conn.cursor(), sql, rows, page_size)
+            conn.commit()
+
+    def tuple_cursor(self, conn: Any):
+        """Return a cursor yielding plain tuples instead of mapping rows.
+
+        Connections default to name-addressable rows (RealDictCursor /
+        sqlite3.Row) because most call sites index rows by column name.
+        Bulk reads that only need positional access can opt out here and
+        skip the per-row dict construction.
+        """
+        return self._backend.tuple_cursor(conn)
+
+    def stream_cursor(self, conn: Any, name: str):
+        """Return a tuple cursor that streams large results instead of buffering them.
+
+        On PostgreSQL this is a server-side cursor called ``name``; rows are
+        pulled in batches as the caller fetches. Only valid until the
+        connection's transaction ends.
+        """
+        return self._backend.stream_cursor(conn, name)
+
+    def init_database(self):
+        """Initialize database tables."""
+        backend = self._backend
         try:
+            if not backend.check_connection(self):
+                return
+
             with self.get_connection() as conn:
                 cursor = conn.cursor()
                 
-                # Get table counts
-                tables = ['users', 'books', 'leagues', 'user_books', 'reading_sessions', 'achievements',
-                          'user_stats', 'motivation_messages', 'visual_elements', 'achievement_definitions']
-                table_counts = {}
+                # Skip the DDL and seeding when the schema is already current
+                if backend.get_schema_version(conn, cursor) == SCHEMA_VERSION:
+                    logger.info(f"Database schema is up to date (version {SCHEMA_VERSION})")
+                    return
+                
+                # Create tables; DDL and seeding share one transaction
+                backend.create_schema(cursor)
+                
+                # Insert default data (one batched statement per table)
+                backend.insert_default_data(cursor)
                 
-                for table in tables:
-                    cursor.execute(f"SELECT COUNT(*) as count FROM {table}")
-                    # Handle both dictionary and tuple results
-                    row = cursor.fetchone()
-                    if hasattr(row, 'keys'): # RealDictCursor
-                        table_counts[table] = row['count']
-                    else:
-                        table_counts[table] = row[0]
+                backend.set_schema_version(cursor)
+                conn.commit()
+                logger.info("Database initialized successfully")
+            
+            self.optimize()
                 
+        except Exception as e:
+            logger.error(f"Failed to initialize database: {e}")
+            raise
+
+    def wait_until_ready(self):
+        """Block until any background initialization finishes.
+
+        Raises RuntimeError (chained to the original error) if it failed, so
+        nothing runs against a missing or half-created schema.
+        """
+        self._ready.wait()
+        if self._init_error is not None:
+            raise RuntimeError("Database initialization failed") from self._init_error
+
+    def init_database_in_background(self, initializer=None) -> threading.Thread:
+        """Run ``initializer`` (default: ``init_database``) on a daemon thread.
+
+        Lets startup continue (e.g. the Telegram handshake) while the schema
+        is created; ``get_connection`` callers on other threads wait until
+        the initializer returns, and get its error if it failed.
+        """
+        def run():
+            try:
+                (initializer or self.init_database)()
+            except Exception as e:
+                logger.error(f"Background database initialization failed: {e}")
+                self._init_error = e
+            finally:
+                self._ready.set()
+
+        self._init_error = None
+        self._ready.clear()
+        self._init_thread = threading.Thread(target=run, name='db-init', daemon=True)
+        self._init_thread.start()
+        return self._init_thread
+
+    def optimize(self):
+        """Let SQLite refresh planner statistics (PRAGMA optimize).
+
+        Cheap when nothing changed; intended to run at startup and
+        periodically. PostgreSQL relies on autovacuum/autoanalyze instead.
+        """
+        self._backend.optimize(self)
+
+    def backup_database(self, backup_path: str) -> bool:
+        """Create a backup of the database."""
+        return self._backend.backup(self, backup_path)
+    
+    def get_database_info(self, exact: bool = False) -> dict:
+        """Get database information and statistics.
+
+        On PostgreSQL the table counts are planner estimates from pg_class
+        unless ``exact`` is True.
+        """
+        try:
+            with self.get_connection(readonly=True) as conn:
+                cursor = self.tuple_cursor(conn)
                 return {
                     'database_type': self.db_type,
-                    'table_counts': table_counts
+                    'table_counts': self._backend.table_counts(cursor, exact),
+                    **self._backend.storage_info(cursor)
                 }
                 
         except Exception as e:
-            self.logger.error(f"Failed to get database info: {e}")
+            logger.error(f"Failed to get database info: {e}")
             return {}
 
 
-# Global database manager instance
-db_manager = DatabaseManager()
+# Global database manager instance, created on first use
+_instance: Optional[DatabaseManager] = None
+
+
+def get_db_manager() -> DatabaseManager:
+    """Return the shared DatabaseManager, creating it on first call."""
+    global _instance
+    if _instance is None:
+        _instance = DatabaseManager()
+    return _instance
+
+
+def __getattr__(name: str):
+    # PEP 562: standalone scripts still do ``from src.database.database import
+    # db_manager``; the bot itself calls get_db_manager() at use time.
+    if name == 'db_manager':
+        return get_db_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
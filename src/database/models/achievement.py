@@ -6,11 +6,23 @@ This module defines the Achievement model and related data structures.
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Sequence
 import json
 
+from src.database.models.utils import json_loads, parse_datetime, require_datetime
 
-@dataclass
+
+def _load_metadata(raw: Any) -> Optional[Dict[str, Any]]:
+    """Decode a stored metadata JSON string, or None if empty or malformed."""
+    if not raw:
+        return None
+    try:
+        return json_loads(raw)
+    except (json.JSONDecodeError, TypeError):
+        return None
+
+
+@dataclass(slots=True)
 class Achievement:
     """Represents a user achievement."""
     
@@ -39,26 +51,24 @@ class Achievement:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'Achievement':
         """Create achievement from dictionary."""
-        metadata = None
-        if data.get('metadata'):
-            try:
-                metadata = json.loads(data['metadata'])
-            except (json.JSONDecodeError, TypeError):
-                metadata = None
-        
         return cls(
             id=data.get('id'),
             user_id=data['user_id'],
             type=data['type'],
             title=data['title'],
             description=data['description'],
-            earned_at=datetime.fromisoformat(data['earned_at']),
-            metadata=metadata,
+            earned_at=require_datetime(data['earned_at']),
+            metadata=_load_metadata(data.get('metadata')),
             is_notified=bool(data.get('is_notified', False))
         )
+    
+    @classmethod
+    def from_row(cls, row: Sequence[Any]) -> 'Achievement':
+        """Create achievement from a plain tuple row selected in field order."""
+        return cls(*row[:5], require_datetime(row[5]), _load_metadata(row[6]), bool(row[7]))
 
 
-@dataclass
+@dataclass(slots=True)
 class AchievementDefinition:
     """Represents an achievement definition template."""
     
@@ -87,13 +97,6 @@ class AchievementDefinition:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'AchievementDefinition':
         """Create achievement definition from dictionary."""
-        created_at = None
-        if data.get('created_at'):
-            try:
-                created_at = datetime.fromisoformat(data['created_at'])
-            except (ValueError, TypeError):
-                created_at = None
-        
         return cls(
             id=data.get('id'),
             type=data['type'],
@@ -102,11 +105,16 @@ class AchievementDefinition:
             icon=data['icon'],
             xp_reward=data['xp_reward'],
             is_active=bool(data.get('is_active', True)),
-            created_at=created_at
+            created_at=parse_datetime(data.get('created_at'))
         )
+    
+    @classmethod
+    def from_row(cls, row: Sequence[Any]) -> 'AchievementDefinition':
+        """Create achievement definition from a plain tuple row selected in field order."""
+        return cls(*row[:6], bool(row[6]), parse_datetime(row[7]))
 
 
-@dataclass
+@dataclass(slots=True)
 class UserStats:
     """Represents user statistics for gamification."""
     
@@ -143,34 +151,6 @@ class UserStats:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'UserStats':
         """Create user stats from dictionary."""
-        last_reading_date = None
-        if data.get('last_reading_date'):
-            try:
-                last_reading_date = datetime.fromisoformat(data['last_reading_date'])
-            except (ValueError, TypeError):
-                last_reading_date = None
-        
-        streak_start_date = None
-        if data.get('streak_start_date'):
-            try:
-                streak_start_date = datetime.fromisoformat(data['streak_start_date'])
-            except (ValueError, TypeError):
-                streak_start_date = None
-        
-        created_at = None
-        if data.get('created_at'):
-            try:
-                created_at = datetime.fromisoformat(data['created_at'])
-            except (ValueError, TypeError):
-                created_at = None
-        
-        updated_at = None
-        if data.get('updated_at'):
-            try:
-                updated_at = datetime.fromisoformat(data['updated_at'])
-            except (ValueError, TypeError):
-                updated_at = None
-        
         return cls(
             user_id=data['user_id'],
             current_streak=data.get('current_streak', 0),
@@ -180,8 +160,8 @@ class UserStats:
             xp=data.get('xp', 0),
             books_completed=data.get('books_completed', 0),
             total_pages_read=data.get('total_pages_read', 0),
-            last_reading_date=last_reading_date,
-            streak_start_date=streak_start_date,
-            created_at=created_at,
-            updated_at=updated_at
+            last_reading_date=parse_datetime(data.get('last_reading_date')),
+            streak_start_date=parse_datetime(data.get('streak_start_date')),
+            created_at=parse_datetime(data.get('created_at')),
+            updated_at=parse_datetime(data.get('updated_at'))
         )
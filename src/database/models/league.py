@@ -5,14 +5,14 @@ This module defines the League data model and related functionality.
 """
 
 from datetime import datetime, date
-from typing import Optional, List, Dict
-from dataclasses import dataclass
+from typing import Optional, List, Dict, Tuple
+from dataclasses import dataclass, fields
 from enum import Enum
 
 from src.config.constants import LeagueStatus
 
 
-@dataclass
+@dataclass(slots=True)
 class League:
     """League data model."""
     
@@ -29,7 +29,16 @@ class League:
     created_at: datetime
     
     def __post_init__(self):
-        """Validate league data after initialization."""
+        """Normalize date fields and validate league data after initialization."""
+        # SQLite returns DATE/TIMESTAMP columns as ISO strings; convert them
+        # once here so the properties below are plain date arithmetic.
+        if isinstance(self.start_date, str):
+            self.start_date = date.fromisoformat(self.start_date[:10])
+        if isinstance(self.end_date, str):
+            self.end_date = date.fromisoformat(self.end_date[:10])
+        if isinstance(self.created_at, str):
+            self.created_at = datetime.fromisoformat(self.created_at)
+        
         if self.start_date >= self.end_date:
             raise ValueError("Start date must be before end date")
         
@@ -42,43 +51,12 @@ class League:
     @property
     def duration_days(self) -> int:
         """Calculate league duration in days."""
-        # Handle both string and date objects
-        if isinstance(self.start_date, str):
-            start_date = date.fromisoformat(self.start_date)
-        else:
-            start_date = self.start_date
-            
-        if isinstance(self.end_date, str):
-            end_date = date.fromisoformat(self.end_date)
-        else:
-            end_date = self.end_date
-            
-        return (end_date - start_date).days
+        return (self.end_date - self.start_date).days
     
     @property
     def is_active(self) -> bool:
         """Check if league is currently active."""
-        today = date.today()
-        
-        # Handle both string and date objects
-        if isinstance(self.start_date, str):
-            start_date = date.fromisoformat(self.start_date)
-        else:
-            start_date = self.start_date
-            
-        if isinstance(self.end_date, str):
-            end_date = date.fromisoformat(self.end_date)
-        else:
-            end_date = self.end_date
-        
-        # For reading leagues, consider active if:
-        # 1. Status is ACTIVE
-        # 2. We haven't passed the end date yet
-        # 3. Start date can be in the future (for registration period)
-        return (
-            self.status == LeagueStatus.ACTIVE and
-            today <= end_date
-        )
+        return self._status_snapshot()[0]
     
     @property
     def is_full(self) -> bool:
@@ -89,48 +67,35 @@ class League:
     @property
     def progress_percentage(self) -> float:
         """Calculate league progress percentage."""
-        if not self.is_active:
-            return 100.0 if self.status == LeagueStatus.COMPLETED else 0.0
-        
-        total_days = self.duration_days
+        return self._status_snapshot()[1]
+    
+    def _status_snapshot(self, today: Optional[date] = None) -> Tuple[bool, float]:
+        """Return ``(is_active, progress_percentage)`` from one ``date.today()`` read."""
+        if today is None:
+            today = date.today()
         
-        # Handle both string and date objects
-        if isinstance(self.start_date, str):
-            start_date = date.fromisoformat(self.start_date)
-        else:
-            start_date = self.start_date
-            
-        elapsed_days = (date.today() - start_date).days
+        # For reading leagues, consider active if:
+        # 1. Status is ACTIVE
+        # 2. We haven't passed the end date yet
+        # 3. Start date can be in the future (for registration period)
+        is_active = self.status == LeagueStatus.ACTIVE and today <= self.end_date
+        if not is_active:
+            return False, 100.0 if self.status == LeagueStatus.COMPLETED else 0.0
         
-        return min(100.0, max(0.0, (elapsed_days / total_days) * 100))
+        elapsed_days = (today - self.start_date).days
+        return True, min(100.0, max(0.0, (elapsed_days / self.duration_days) * 100))
     
     def to_dict(self) -> Dict:
         """Convert league to dictionary."""
-        # Handle date/datetime objects that might be strings from database
-        def format_date(date_obj):
-            if isinstance(date_obj, str):
-                return date_obj
-            elif hasattr(date_obj, 'isoformat'):
-                return date_obj.isoformat()
-            else:
-                return str(date_obj)
-        
-        return {
-            'league_id': self.league_id,
-            'name': self.name,
-            'description': self.description,
-            'admin_id': self.admin_id,
-            'current_book_id': self.current_book_id,
-            'start_date': format_date(self.start_date),
-            'end_date': format_date(self.end_date),
-            'daily_goal': self.daily_goal,
-            'max_members': self.max_members,
-            'status': self.status.value,
-            'created_at': format_date(self.created_at),
-            'duration_days': self.duration_days,
-            'is_active': self.is_active,
-            'progress_percentage': self.progress_percentage
-        }
+        data = {name: getattr(self, name) for name in _LEAGUE_FIELDS}
+        # Dates are normalized in __post_init__, so no type checks are needed
+        data['start_date'] = self.start_date.isoformat()
+        data['end_date'] = self.end_date.isoformat()
+        data['status'] = self.status.value
+        data['created_at'] = self.created_at.isoformat() if self.created_at else None
+        data['duration_days'] = self.duration_days
+        data['is_active'], data['progress_percentage'] = self._status_snapshot()
+        return data
     
     @classmethod
     def from_dict(cls, data: Dict) -> 'League':
@@ -175,3 +140,7 @@ class League:
             status=LeagueStatus.ACTIVE,
             created_at=datetime.now()
         )
+
+
+# Field names in declaration order, resolved once for to_dict
+_LEAGUE_FIELDS = tuple(field.name for field in fields(League))
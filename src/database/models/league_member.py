@@ -9,7 +9,7 @@ from typing import Optional, Dict
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class LeagueMember:
     """League member data model."""
     
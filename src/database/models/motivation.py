@@ -9,8 +9,10 @@ from datetime import datetime
 from typing import Optional, Dict, Any
 import json
 
+from src.database.models.utils import json_loads, parse_datetime, require_datetime
 
-@dataclass
+
+@dataclass(slots=True)
 class MotivationMessage:
     """Represents a motivation message sent to a user."""
     
@@ -40,7 +42,7 @@ class MotivationMessage:
         metadata = None
         if data.get('metadata'):
             try:
-                metadata = json.loads(data['metadata'])
+                metadata = json_loads(data['metadata'])
             except (json.JSONDecodeError, TypeError):
                 metadata = None
         
@@ -49,13 +51,13 @@ class MotivationMessage:
             user_id=data['user_id'],
             message_type=data['message_type'],
             content=data['content'],
-            sent_at=datetime.fromisoformat(data['sent_at']),
+            sent_at=require_datetime(data['sent_at']),
             is_read=bool(data.get('is_read', False)),
             metadata=metadata
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class VisualElement:
     """Represents a visual element (progress bar, badge, certificate)."""
     
@@ -82,20 +84,13 @@ class VisualElement:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'VisualElement':
         """Create visual element from dictionary."""
-        expires_at = None
-        if data.get('expires_at'):
-            try:
-                expires_at = datetime.fromisoformat(data['expires_at'])
-            except (ValueError, TypeError):
-                expires_at = None
-        
         return cls(
             id=data.get('id'),
             user_id=data['user_id'],
             element_type=data['element_type'],
             data=data['data'],
-            created_at=datetime.fromisoformat(data['created_at']),
-            expires_at=expires_at,
+            created_at=require_datetime(data['created_at']),
+            expires_at=parse_datetime(data.get('expires_at')),
             is_active=bool(data.get('is_active', True))
         )
 
@@ -123,6 +118,9 @@ class MessageType:
     LEAGUE_UPDATE = "league_update"
     FRIEND_ACHIEVEMENT = "friend_achievement"
     COMMUNITY_CHALLENGE = "community_challenge"
+    
+    # Every message type above, for O(1) validation (``value in MessageType.ALL``)
+    ALL = frozenset(v for k, v in vars().items() if not k.startswith('_') and isinstance(v, str))
 
 
 # Visual element types
@@ -134,3 +132,6 @@ class VisualElementType:
     CERTIFICATE = "certificate"
     LEVEL_INDICATOR = "level_indicator"
     STREAK_DISPLAY = "streak_display"
+    
+    # Every visual element type above, for O(1) validation
+    ALL = frozenset(v for k, v in vars().items() if not k.startswith('_') and isinstance(v, str))
@@ -9,8 +9,10 @@ from datetime import datetime, date
 from typing import Optional, Dict, Any
 import json
 
+from src.database.models.utils import parse_datetime
 
-@dataclass
+
+@dataclass(slots=True)
 class UserProfile:
     """Represents a user's profile information."""
     
@@ -49,20 +51,6 @@ class UserProfile:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> 'UserProfile':
         """Create profile from dictionary."""
-        created_at = None
-        if data.get('created_at'):
-            try:
-                created_at = datetime.fromisoformat(data['created_at'])
-            except (ValueError, TypeError):
-                created_at = None
-        
-        updated_at = None
-        if data.get('updated_at'):
-            try:
-                updated_at = datetime.fromisoformat(data['updated_at'])
-            except (ValueError, TypeError):
-                updated_at = None
-        
         return cls(
             user_id=data['user_id'],
             display_name=data.get('display_name'),
@@ -75,12 +63,12 @@ class UserProfile:
             privacy_level=data.get('privacy_level', 'public'),
             show_achievements=bool(data.get('show_achievements', True)),
             show_reading_stats=bool(data.get('show_reading_stats', True)),
-            created_at=created_at,
-            updated_at=updated_at
+            created_at=parse_datetime(data.get('created_at')),
+            updated_at=parse_datetime(data.get('updated_at'))
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ProfileStatistics:
     """Represents comprehensive user reading statistics."""
     
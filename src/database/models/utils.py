@@ -0,0 +1,47 @@
+"""
+Shared helpers for model serialization.
+
+Timestamp parsing used by the models' ``from_dict`` constructors and JSON
+decoding for metadata columns.
+"""
+
+import json
+from datetime import date, datetime, time
+from functools import lru_cache
+from typing import Any, Optional
+
+# orjson is optional and only used to read metadata; writes stay on json.dumps
+# so stored rows keep its ", " / ": " formatting byte for byte.
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+
+@lru_cache(maxsize=4096)
+def parse_iso_datetime(value: str) -> datetime:
+    """Parse an ISO timestamp string; result sets often repeat the same values."""
+    return datetime.fromisoformat(value)
+
+
+def require_datetime(value: Any) -> datetime:
+    """Convert a required timestamp (ISO string or datetime) to a datetime."""
+    if isinstance(value, datetime):
+        return value
+    return parse_iso_datetime(value)
+
+
+def parse_datetime(value: Any) -> Optional[datetime]:
+    """Convert an optional timestamp (ISO string, date or datetime) to a datetime, or None."""
+    if not value:
+        return None
+    if isinstance(value, str):
+        try:
+            return parse_iso_datetime(value)
+        except ValueError:
+            return None
+    if isinstance(value, datetime):
+        return value
+    if isinstance(value, date):
+        return datetime.combine(value, time.min)
+    return None
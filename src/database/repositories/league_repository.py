@@ -5,14 +5,187 @@ This module handles all database operations related to leagues and league member
 """
 
 import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import replace
 from datetime import date, datetime
-from typing import List, Optional, Dict, Tuple
+from array import array
+from typing import Any, List, Optional, Dict, Tuple, Sequence, Iterable, Set
 from sqlite3 import Connection
 
 from src.database.models.league import League
 from src.database.models.league_member import LeagueMember
 from src.config.constants import LeagueStatus
 
+# Enum members by stored value; a dict lookup is cheaper than LeagueStatus(value)
+_STATUS_BY_VALUE = {status.value: status for status in LeagueStatus}
+
+# Statements used by the repository methods, kept as module constants so each
+# query is a single string object shared by every call
+_LEAGUE_COLUMNS = (
+    "league_id", "name", "description", "admin_id", "current_book_id",
+    "start_date", "end_date", "daily_goal", "max_members", "status", "created_at",
+)
+_SELECT_LEAGUES = f"SELECT {', '.join(_LEAGUE_COLUMNS)} FROM leagues"
+_LEAGUE_BY_ID_SQL = f"{_SELECT_LEAGUES} WHERE league_id = %s"
+_LEAGUES_BY_STATUS_SQL = f"{_SELECT_LEAGUES} WHERE status = %s ORDER BY created_at DESC"
+_ALL_LEAGUES_SQL = f"{_SELECT_LEAGUES} ORDER BY created_at DESC"
+_LEAGUES_BY_ADMIN_SQL = f"{_SELECT_LEAGUES} WHERE admin_id = %s ORDER BY created_at DESC"
+_USER_LEAGUES_SQL = f"""
+    SELECT {', '.join('l.' + column for column in _LEAGUE_COLUMNS)}
+    FROM leagues l
+    JOIN league_members lm ON l.league_id = lm.league_id
+    WHERE lm.user_id = %s AND lm.is_active = TRUE
+    ORDER BY l.created_at DESC
+"""
+_USER_LEAGUES_WITH_COUNTS_SQL = f"""
+    SELECT {', '.join('l.' + column for column in _LEAGUE_COLUMNS)},
+           (SELECT COUNT(*) FROM league_members active
+            WHERE active.league_id = l.league_id AND active.is_active = TRUE)
+    FROM leagues l
+    JOIN league_members lm ON l.league_id = lm.league_id
+    WHERE lm.user_id = %s AND lm.is_active = TRUE
+    ORDER BY l.created_at DESC
+"""
+# Active leagues the user is not in and that still have a free seat; the
+# derived table lets the WHERE clause filter on the member count
+_AVAILABLE_LEAGUES_WITH_COUNTS_SQL = f"""
+    SELECT {', '.join(_LEAGUE_COLUMNS)}, member_count
+    FROM (
+        SELECT {', '.join('l.' + column for column in _LEAGUE_COLUMNS)},
+               (SELECT COUNT(*) FROM league_members active
+                WHERE active.league_id = l.league_id AND active.is_active = TRUE) AS member_count
+        FROM leagues l
+        WHERE l.status = %s
+        AND NOT EXISTS (
+            SELECT 1 FROM league_members lm
+            WHERE lm.league_id = l.league_id AND lm.user_id = %s AND lm.is_active = TRUE
+        )
+    ) available
+    WHERE member_count < max_members
+    ORDER BY created_at DESC
+"""
+# Serializes joins to one league on PostgreSQL (see add_member_to_league)
+_LOCK_LEAGUE_SQL = "SELECT 1 FROM leagues WHERE league_id = %s FOR UPDATE"
+_ADD_MEMBER_SQL = """
+    INSERT INTO league_members (league_id, user_id, joined_at, is_active)
+    SELECT l.league_id, %s, %s, TRUE
+    FROM leagues l
+    WHERE l.league_id = %s
+    AND NOT EXISTS (
+        SELECT 1 FROM league_members
+        WHERE league_id = l.league_id AND is_active = TRUE AND user_id = %s
+    )
+    AND (
+        SELECT COUNT(*) FROM league_members
+        WHERE league_id = l.league_id AND is_active = TRUE
+    ) < l.max_members
+    ON CONFLICT (league_id, user_id) DO UPDATE
+    SET is_active = TRUE, joined_at = excluded.joined_at
+    WHERE league_members.is_active = FALSE
+"""
+_LEAGUE_MEMBERS_SQL = """
+    SELECT league_id, user_id, joined_at, is_active
+    FROM league_members
+    WHERE league_id = %s AND is_active = TRUE
+    ORDER BY joined_at ASC
+"""
+_MEMBER_COUNT_SQL = """
+    SELECT COUNT(*) FROM league_members
+    WHERE league_id = %s AND is_active = TRUE
+"""
+_REMOVE_MEMBER_SQL = """
+    UPDATE league_members SET is_active = FALSE
+    WHERE league_id = %s AND user_id = %s
+"""
+_UPDATE_STATUS_SQL = "UPDATE leagues SET status = %s WHERE league_id = %s"
+_UPDATE_GOAL_SQL = "UPDATE leagues SET daily_goal = %s WHERE league_id = %s"
+_UPDATE_DATES_SQL = "UPDATE leagues SET start_date = %s, end_date = %s WHERE league_id = %s"
+_UPDATE_MAX_MEMBERS_SQL = "UPDATE leagues SET max_members = %s WHERE league_id = %s"
+_UPDATE_BOOK_SQL = "UPDATE leagues SET current_book_id = %s WHERE league_id = %s"
+# Formatted with one %s placeholder per user id, at most _IN_CHUNK_SIZE at a
+# time so a statement stays under SQLite's 999 bound-variable limit
+_IN_CHUNK_SIZE = 500
+_ACTIVE_MEMBERS_AMONG_SQL = """
+    SELECT user_id FROM league_members
+    WHERE league_id = %s AND is_active = TRUE AND user_id IN ({})
+"""
+_IS_MEMBER_SQL = """
+    SELECT EXISTS (
+        SELECT 1 FROM league_members
+        WHERE league_id = %s AND is_active = TRUE AND user_id = %s
+    )
+"""
+
+
+def _league_from_row(row) -> League:
+    """Build a League from a tuple row in League field order."""
+    return League(*row[:9], _STATUS_BY_VALUE[row[9]], row[10])
+
+
+def _leagues_from_cursor(cursor, batch_size: int = 512) -> List[League]:
+    """Build League objects from a tuple cursor, fetching rows in batches."""
+    league, status_by_value = League, _STATUS_BY_VALUE
+    leagues = []
+    rows = cursor.fetchmany(batch_size)
+    while rows:
+        leagues.extend(league(*row[:9], status_by_value[row[9]], row[10]) for row in rows)
+        rows = cursor.fetchmany(batch_size)
+    return leagues
+
+
+# Leagues and member counts read while handling the current update, keyed by
+# (kind, league_id). begin_request_cache() installs a fresh dict per update,
+# so writes made outside the repository are picked up by the next update;
+# outside an update (jobs, scripts) nothing is cached.
+_request_cache: ContextVar[Optional[Dict[Tuple[str, int], Any]]] = ContextVar(
+    'league_request_cache', default=None
+)
+
+
+def begin_request_cache() -> None:
+    """Start an empty league cache for the update being handled."""
+    _request_cache.set({})
+
+
+def _cache_get(kind: str, league_id: int) -> Any:
+    cache = _request_cache.get()
+    return cache.get((kind, league_id)) if cache is not None else None
+
+
+def _cache_put(kind: str, league_id: int, value: Any) -> None:
+    cache = _request_cache.get()
+    if cache is not None:
+        cache[(kind, league_id)] = value
+
+
+def _cache_discard(kind: str, league_id: int) -> None:
+    cache = _request_cache.get()
+    if cache is not None:
+        cache.pop((kind, league_id), None)
+
+
+# Connection of the LeagueRepository.transaction() block running in the
+# current thread / asyncio task, if any
+_transaction_conn: ContextVar[Optional[Any]] = ContextVar('league_transaction_conn', default=None)
+
+
+# Column order of LeagueRepository.export_league_columns
+EXPORT_COLUMNS = (
+    "full_name", "city", "book_title", "book_author",
+    "total_pages", "pages_read", "start_date", "last_updated",
+)
+_INT_EXPORT_COLUMNS = frozenset(("total_pages", "pages_read"))
+_EXPORT_BATCH_SIZE = 2000
+
+
+def _export_columns(transposed) -> Dict[str, Sequence]:
+    """Name transposed export rows by EXPORT_COLUMNS, packing integer columns into arrays."""
+    return {
+        name: array('q', values) if name in _INT_EXPORT_COLUMNS else list(values)
+        for name, values in zip(EXPORT_COLUMNS, transposed)
+    }
+
 
 class LeagueRepository:
     """Repository for league-related database operations."""
@@ -22,11 +195,81 @@ class LeagueRepository:
         self.db_manager = db_manager
         self.logger = logging.getLogger(__name__)
     
-    def create_league(self, league: League) -> int:
-        """Create a new league and return its ID."""
+    def _fetch_value(self, sql: str, params: Tuple, action: str) -> Any:
+        """Run a query and return the first column of its first row (None if no row)."""
         try:
             with self.db_manager.get_connection() as conn:
+                cursor = self.db_manager.tuple_cursor(conn)
+                cursor.execute(sql, params)
+                row = cursor.fetchone()
+                return row[0] if row else None
+        except Exception as e:
+            self.logger.error("Failed to %s: %s", action, e)
+            raise
+    
+    @contextmanager
+    def _write_connection(self):
+        """Yield the open transaction's connection, else a pooled one committed on success."""
+        conn = _transaction_conn.get()
+        if conn is not None:
+            yield conn
+            return
+        with self.db_manager.get_connection() as conn:
+            yield conn
+            conn.commit()
+    
+    def _write(self, sql: str, params: Tuple, action: str) -> bool:
+        """Run and commit a single write; return whether it changed any row."""
+        try:
+            with self._write_connection() as conn:
                 cursor = conn.cursor()
+                cursor.execute(sql, params)
+                return cursor.rowcount > 0
+        except Exception as e:
+            self.logger.error("Failed to %s: %s", action, e)
+            raise
+    
+    def _lock_league(self, cursor, league_id: int) -> None:
+        """Hold the league's row lock until commit (PostgreSQL only)."""
+        if self.db_manager.db_type == 'postgres':
+            cursor.execute(_LOCK_LEAGUE_SQL, (league_id,))
+    
+    @contextmanager
+    def transaction(self):
+        """Commit the repository writes made inside the block together.
+
+        create_league and the single-statement mutators share one connection
+        until the block exits, then commit once (or roll back if it raises).
+        Nested blocks join the outer one. Reads inside the block only see
+        committed data.
+        """
+        if _transaction_conn.get() is not None:
+            yield
+            return
+        with self.db_manager.get_connection() as conn:
+            token = _transaction_conn.set(conn)
+            try:
+                yield
+                conn.commit()
+            except BaseException:
+                conn.rollback()
+                raise
+            finally:
+                _transaction_conn.reset(token)
+                # Reads made during the block may have cached pre-commit state
+                self.flush_cache()
+    
+    def flush_cache(self) -> None:
+        """Drop every league and member count cached for the current update."""
+        cache = _request_cache.get()
+        if cache is not None:
+            cache.clear()
+    
+    def create_league(self, league: League) -> int:
+        """Create a new league and return its ID."""
+        try:
+            with self._write_connection() as conn:
+                cursor = self.db_manager.tuple_cursor(conn)
                 
                 cursor.execute("""
                     INSERT INTO leagues (
@@ -42,400 +285,273 @@ class LeagueRepository:
                     league.created_at
                 ))
                 
-                league_id = cursor.fetchone()['league_id']
-                conn.commit()
+                league_id = cursor.fetchone()[0]
                 
-                self.logger.info(f"Created league '{league.name}' with ID {league_id}")
+                self.logger.info("Created league '%s' with ID %s", league.name, league_id)
                 return league_id
             
         except Exception as e:
-            self.logger.error(f"Failed to create league: {e}")
+            self.logger.error("Failed to create league: %s", e)
             raise
     
     def get_league_by_id(self, league_id: int) -> Optional[League]:
-        """Get league by ID."""
+        """Get league by ID.
+
+        Found leagues are cached for the rest of the current update; each
+        caller gets its own copy, so changing one does not touch the cache.
+        """
+        league = _cache_get("league", league_id)
+        if league is not None:
+            return replace(league)
         try:
             with self.db_manager.get_connection() as conn:
-                cursor = conn.cursor()
+                cursor = self.db_manager.tuple_cursor(conn)
                 
-                cursor.execute("""
-                    SELECT league_id, name, description, admin_id, current_book_id,
-                           start_date, end_date, daily_goal, max_members, status, created_at
-                    FROM leagues WHERE league_id = %s
-                """, (league_id,))
+                cursor.execute(_LEAGUE_BY_ID_SQL, (league_id,))
                 
                 row = cursor.fetchone()
-                if row:
-                    return League(
-                        league_id=row['league_id'],
-                        name=row['name'],
-                        description=row['description'],
-                        admin_id=row['admin_id'],
-                        current_book_id=row['current_book_id'],
-                        start_date=row['start_date'],
-                        end_date=row['end_date'],
-                        daily_goal=row['daily_goal'],
-                        max_members=row['max_members'],
-                        status=LeagueStatus(row['status']),
-                        created_at=row['created_at']
-                    )
-                return None
+                if row is None:
+                    return None
+                league = _league_from_row(row)
+                _cache_put("league", league_id, replace(league))
+                return league
             
         except Exception as e:
-            self.logger.error(f"Failed to get league {league_id}: {e}")
+            self.logger.error("Failed to get league %s: %s", league_id, e)
             raise
     
     def get_active_leagues(self) -> List[League]:
         """Get all active leagues."""
         try:
             with self.db_manager.get_connection() as conn:
-                cursor = conn.cursor()
-                
-                cursor.execute("""
-                    SELECT league_id, name, description, admin_id, current_book_id,
-                           start_date, end_date, daily_goal, max_members, status, created_at
-                    FROM leagues WHERE status = %s ORDER BY created_at DESC
-                """, (LeagueStatus.ACTIVE.value,))
+                cursor = self.db_manager.tuple_cursor(conn)
                 
-                leagues = []
-                for row in cursor.fetchall():
-                    league = League(
-                        league_id=row['league_id'],
-                        name=row['name'],
-                        description=row['description'],
-                        admin_id=row['admin_id'],
-                        current_book_id=row['current_book_id'],
-                        start_date=row['start_date'],
-                        end_date=row['end_date'],
-                        daily_goal=row['daily_goal'],
-                        max_members=row['max_members'],
-                        status=LeagueStatus(row['status']),
-                        created_at=row['created_at']
-                    )
-                    leagues.append(league)
+                cursor.execute(_LEAGUES_BY_STATUS_SQL, (LeagueStatus.ACTIVE.value,))
                 
-                return leagues
+                return _leagues_from_cursor(cursor)
             
         except Exception as e:
-            self.logger.error(f"Failed to get active leagues: {e}")
+            self.logger.error("Failed to get active leagues: %s", e)
             raise
     
     def get_all_leagues(self) -> List[League]:
         """Get all leagues (active and inactive)."""
         try:
             with self.db_manager.get_connection() as conn:
-                cursor = conn.cursor()
-                
-                cursor.execute("""
-                    SELECT league_id, name, description, admin_id, current_book_id,
-                           start_date, end_date, daily_goal, max_members, status, created_at
-                    FROM leagues ORDER BY created_at DESC
-                """)
+                cursor = self.db_manager.tuple_cursor(conn)
                 
-                leagues = []
-                for row in cursor.fetchall():
-                    league = League(
-                        league_id=row['league_id'],
-                        name=row['name'],
-                        description=row['description'],
-                        admin_id=row['admin_id'],
-                        current_book_id=row['current_book_id'],
-                        start_date=row['start_date'],
-                        end_date=row['end_date'],
-                        daily_goal=row['daily_goal'],
-                        max_members=row['max_members'],
-                        status=LeagueStatus(row['status']),
-                        created_at=row['created_at']
-                    )
-                    leagues.append(league)
+                cursor.execute(_ALL_LEAGUES_SQL)
                 
-                return leagues
+                return _leagues_from_cursor(cursor)
             
         except Exception as e:
-            self.logger.error(f"Failed to get all leagues: {e}")
+            self.logger.error("Failed to get all leagues: %s", e)
             raise
     
     def get_leagues_by_admin(self, admin_id: int) -> List[League]:
         """Get all leagues created by a specific admin."""
         try:
             with self.db_manager.get_connection() as conn:
-                cursor = conn.cursor()
+                cursor = self.db_manager.tuple_cursor(conn)
                 
-                cursor.execute("""
-                    SELECT league_id, name, description, admin_id, current_book_id,
-                           start_date, end_date, daily_goal, max_members, status, created_at
-                    FROM leagues WHERE admin_id = %s ORDER BY created_at DESC
-                """, (admin_id,))
-                
-                leagues = []
-                for row in cursor.fetchall():
-                    league = League(
-                        league_id=row['league_id'],
-                        name=row['name'],
-                        description=row['description'],
-                        admin_id=row['admin_id'],
-                        current_book_id=row['current_book_id'],
-                        start_date=row['start_date'],
-                        end_date=row['end_date'],
-                        daily_goal=row['daily_goal'],
-                        max_members=row['max_members'],
-                        status=LeagueStatus(row['status']),
-                        created_at=row['created_at']
-                    )
-                    leagues.append(league)
+                cursor.execute(_LEAGUES_BY_ADMIN_SQL, (admin_id,))
                 
-                return leagues
+                return _leagues_from_cursor(cursor)
             
         except Exception as e:
-            self.logger.error(f"Failed to get leagues for admin {admin_id}: {e}")
+            self.logger.error("Failed to get leagues for admin %s: %s", admin_id, e)
             raise
     
     def update_league_status(self, league_id: int, status: LeagueStatus) -> bool:
         """Update league status."""
+        _cache_discard("league", league_id)
+        if self._write(_UPDATE_STATUS_SQL, (status.value, league_id), "update league status"):
+            self.logger.info("Updated league %s status to %s", league_id, status.value)
+            return True
+        return False
+    
+    def add_member_to_league(self, league_id: int, user_id: int) -> bool:
+        """Add a user to a league."""
+        # Membership and capacity checks run inside the INSERT itself; a
+        # former member's inactive row is reactivated rather than rejected by
+        # the primary key. SQLite runs one writer at a time, but under
+        # PostgreSQL's READ COMMITTED two joins could both see a free seat,
+        # so the league row is locked first and the INSERT's snapshot then
+        # includes every join committed before it.
+        params = (user_id, datetime.now(), league_id, user_id)
+        _cache_discard("members", league_id)
         try:
-            with self.db_manager.get_connection() as conn:
+            with self._write_connection() as conn:
                 cursor = conn.cursor()
-                
-                cursor.execute("""
-                    UPDATE leagues SET status = %s WHERE league_id = %s
-                """, (status.value, league_id))
-                
-                if cursor.rowcount > 0:
-                    conn.commit()
-                    self.logger.info(f"Updated league {league_id} status to {status.value}")
-                    return True
-                return False
-            
+                self._lock_league(cursor, league_id)
+                cursor.execute(_ADD_MEMBER_SQL, params)
+                added = cursor.rowcount > 0
         except Exception as e:
-            self.logger.error(f"Failed to update league {league_id} status: {e}")
+            self.logger.error("Failed to add member to league: %s", e)
             raise
+        if added:
+            self.logger.info("Added user %s to league %s", user_id, league_id)
+            return True
+        self.logger.warning(
+            "User %s not added to league %s: already a member or league is full", user_id, league_id
+        )
+        return False
     
-    def add_member_to_league(self, league_id: int, user_id: int) -> bool:
-        """Add a user to a league."""
+    def add_members_to_league(self, league_id: int, user_ids: Iterable[int]) -> None:
+        """Add several users to a league in one batched transaction.
+
+        Each user goes through the same guarded insert as add_member_to_league,
+        so existing members are skipped and max_members is never exceeded.
+        Inside transaction() the inserts join the open block.
+        """
+        now = datetime.now()
+        _cache_discard("members", league_id)
         try:
-            with self.db_manager.get_connection() as conn:
+            with self._write_connection() as conn:
                 cursor = conn.cursor()
-                
-                # Check if user is already a member
-                cursor.execute("""
-                    SELECT 1 FROM league_members 
-                    WHERE league_id = %s AND user_id = %s
-                """, (league_id, user_id))
-                
-                if cursor.fetchone():
-                    self.logger.warning(f"User {user_id} is already a member of league {league_id}")
-                    return False
-                
-                # Check if league is full
-                cursor.execute("""
-                    SELECT COUNT(*) as count FROM league_members 
-                    WHERE league_id = %s AND is_active = TRUE
-                """, (league_id,))
-                
-                current_members = cursor.fetchone()['count']
-                
-                cursor.execute("""
-                    SELECT max_members FROM leagues WHERE league_id = %s
-                """, (league_id,))
-                
-                max_members = cursor.fetchone()['max_members']
-                
-                if current_members >= max_members:
-                    self.logger.warning(f"League {league_id} is full")
-                    return False
-                
-                # Add member
-                cursor.execute("""
-                    INSERT INTO league_members (league_id, user_id, joined_at, is_active)
-                    VALUES (%s, %s, %s, TRUE)
-                """, (league_id, user_id, datetime.now()))
-                
-                conn.commit()
-                self.logger.info(f"Added user {user_id} to league {league_id}")
-                return True
-            
+                self._lock_league(cursor, league_id)
+                cursor.executemany(
+                    _ADD_MEMBER_SQL, [(user_id, now, league_id, user_id) for user_id in user_ids]
+                )
         except Exception as e:
-            self.logger.error(f"Failed to add member to league: {e}")
+            self.logger.error("Failed to add members to league %s: %s", league_id, e)
             raise
     
     def remove_member_from_league(self, league_id: int, user_id: int) -> bool:
         """Remove a user from a league."""
+        _cache_discard("members", league_id)
+        if self._write(_REMOVE_MEMBER_SQL, (league_id, user_id), "remove member from league"):
+            self.logger.info("Removed user %s from league %s", user_id, league_id)
+            return True
+        return False
+    
+    def get_league_members(self, league_id: int) -> List[LeagueMember]:
+        """Get all active members of a league."""
         try:
             with self.db_manager.get_connection() as conn:
-                cursor = conn.cursor()
+                cursor = self.db_manager.tuple_cursor(conn)
                 
-                cursor.execute("""
-                    UPDATE league_members 
-                    SET is_active = FALSE 
-                    WHERE league_id = %s AND user_id = %s
-                """, (league_id, user_id))
+                cursor.execute(_LEAGUE_MEMBERS_SQL, (league_id,))
                 
-                if cursor.rowcount > 0:
-                    conn.commit()
-                    self.logger.info(f"Removed user {user_id} from league {league_id}")
-                    return True
-                return False
+                return [
+                    LeagueMember(member_league_id, user_id, joined_at, bool(is_active))
+                    for member_league_id, user_id, joined_at, is_active in cursor.fetchall()
+                ]
             
         except Exception as e:
-            self.logger.error(f"Failed to remove member from league: {e}")
+            self.logger.error("Failed to get league members: %s", e)
             raise
     
-    def get_league_members(self, league_id: int) -> List[LeagueMember]:
-        """Get all active members of a league."""
+    def get_user_leagues(self, user_id: int) -> List[League]:
+        """Get all leagues a user is a member of."""
         try:
             with self.db_manager.get_connection() as conn:
-                cursor = conn.cursor()
+                cursor = self.db_manager.tuple_cursor(conn)
                 
-                cursor.execute("""
-                    SELECT league_id, user_id, joined_at, is_active
-                    FROM league_members 
-                    WHERE league_id = %s AND is_active = TRUE
-                    ORDER BY joined_at ASC
-                """, (league_id,))
-                
-                members = []
-                for row in cursor.fetchall():
-                    member = LeagueMember(
-                        league_id=row['league_id'],
-                        user_id=row['user_id'],
-                        joined_at=row['joined_at'],
-                        is_active=bool(row['is_active'])
-                    )
-                    members.append(member)
+                cursor.execute(_USER_LEAGUES_SQL, (user_id,))
                 
-                return members
+                return _leagues_from_cursor(cursor)
             
         except Exception as e:
-            self.logger.error(f"Failed to get league members: {e}")
+            self.logger.error("Failed to get user leagues: %s", e)
             raise
     
-    def get_user_leagues(self, user_id: int) -> List[League]:
-        """Get all leagues a user is a member of."""
+    def get_user_leagues_with_counts(self, user_id: int) -> List[Tuple[League, int]]:
+        """Get the leagues a user is a member of, each with its active member count."""
         try:
             with self.db_manager.get_connection() as conn:
-                cursor = conn.cursor()
+                cursor = self.db_manager.tuple_cursor(conn)
                 
-                cursor.execute("""
-                    SELECT l.league_id, l.name, l.description, l.admin_id, l.current_book_id,
-                           l.start_date, l.end_date, l.daily_goal, l.max_members, l.status, l.created_at
-                    FROM leagues l
-                    JOIN league_members lm ON l.league_id = lm.league_id
-                    WHERE lm.user_id = %s AND lm.is_active = TRUE
-                    ORDER BY l.created_at DESC
-                """, (user_id,))
+                cursor.execute(_USER_LEAGUES_WITH_COUNTS_SQL, (user_id,))
                 
-                leagues = []
-                for row in cursor.fetchall():
-                    league = League(
-                        league_id=row['league_id'],
-                        name=row['name'],
-                        description=row['description'],
-                        admin_id=row['admin_id'],
-                        current_book_id=row['current_book_id'],
-                        start_date=row['start_date'],
-                        end_date=row['end_date'],
-                        daily_goal=row['daily_goal'],
-                        max_members=row['max_members'],
-                        status=LeagueStatus(row['status']),
-                        created_at=row['created_at']
-                    )
-                    leagues.append(league)
-                
-                return leagues
+                return [(_league_from_row(row), row[11]) for row in cursor.fetchall()]
             
         except Exception as e:
-            self.logger.error(f"Failed to get user leagues: {e}")
+            self.logger.error("Failed to get user leagues with member counts: %s", e)
             raise
     
-    def get_league_member_count(self, league_id: int) -> int:
-        """Get the current number of active members in a league."""
+    def get_available_leagues_with_counts(self, user_id: int) -> List[Tuple[League, int]]:
+        """Get the active leagues a user can join, each with its active member count."""
         try:
             with self.db_manager.get_connection() as conn:
-                cursor = conn.cursor()
+                cursor = self.db_manager.tuple_cursor(conn)
                 
-                cursor.execute("""
-                    SELECT COUNT(*) as count FROM league_members 
-                    WHERE league_id = %s AND is_active = TRUE
-                """, (league_id,))
+                cursor.execute(_AVAILABLE_LEAGUES_WITH_COUNTS_SQL, (LeagueStatus.ACTIVE.value, user_id))
                 
-                return cursor.fetchone()['count']
+                return [(_league_from_row(row), row[11]) for row in cursor.fetchall()]
             
         except Exception as e:
-            self.logger.error(f"Failed to get league member count: {e}")
+            self.logger.error("Failed to get available leagues for user %s: %s", user_id, e)
             raise
     
+    def get_league_member_count(self, league_id: int) -> int:
+        """Get the current number of active members in a league (cached per update)."""
+        count = _cache_get("members", league_id)
+        if count is None:
+            count = self._fetch_value(_MEMBER_COUNT_SQL, (league_id,), "get league member count")
+            _cache_put("members", league_id, count)
+        return count
+    
     def is_user_member(self, league_id: int, user_id: int) -> bool:
         """Check if a user is a member of a league."""
+        return bool(self._fetch_value(_IS_MEMBER_SQL, (league_id, user_id), "check user membership"))
+
+    def are_users_members(self, league_id: int, user_ids: Iterable[int]) -> Set[int]:
+        """Return which of the given users are active members of a league."""
+        user_ids = list(user_ids)
+        members = set()
+        if not user_ids:
+            return members
         try:
             with self.db_manager.get_connection() as conn:
-                cursor = conn.cursor()
+                cursor = self.db_manager.tuple_cursor(conn)
                 
-                cursor.execute("""
-                    SELECT 1 FROM league_members 
-                    WHERE league_id = %s AND user_id = %s AND is_active = TRUE
-                """, (league_id, user_id))
+                for start in range(0, len(user_ids), _IN_CHUNK_SIZE):
+                    chunk = user_ids[start:start + _IN_CHUNK_SIZE]
+                    cursor.execute(
+                        _ACTIVE_MEMBERS_AMONG_SQL.format(', '.join(['%s'] * len(chunk))),
+                        (league_id, *chunk),
+                    )
+                    members.update(user_id for user_id, in cursor.fetchall())
                 
-                return cursor.fetchone() is not None
+                return members
             
         except Exception as e:
-            self.logger.error(f"Failed to check user membership: {e}")
+            self.logger.error("Failed to check league memberships: %s", e)
             raise
-
+    
     def update_goal(self, league_id: int, daily_goal: int) -> bool:
-        try:
-            with self.db_manager.get_connection() as conn:
-                cur = conn.cursor()
-                cur.execute("UPDATE leagues SET daily_goal = %s WHERE league_id = %s", (daily_goal, league_id))
-                conn.commit()
-                return cur.rowcount > 0
-        except Exception as e:
-            self.logger.error(f"Failed to update goal: {e}")
-            raise
+        _cache_discard("league", league_id)
+        return self._write(_UPDATE_GOAL_SQL, (daily_goal, league_id), "update goal")
 
     def update_dates(self, league_id: int, start_date: date, end_date: date) -> bool:
-        try:
-            with self.db_manager.get_connection() as conn:
-                cur = conn.cursor()
-                cur.execute(
-                    "UPDATE leagues SET start_date = %s, end_date = %s WHERE league_id = %s",
-                    (start_date, end_date, league_id),
-                )
-                conn.commit()
-                return cur.rowcount > 0
-        except Exception as e:
-            self.logger.error(f"Failed to update dates: {e}")
-            raise
+        _cache_discard("league", league_id)
+        return self._write(_UPDATE_DATES_SQL, (start_date, end_date, league_id), "update dates")
 
     def update_max_members(self, league_id: int, max_members: int) -> bool:
-        try:
-            with self.db_manager.get_connection() as conn:
-                cur = conn.cursor()
-                cur.execute("UPDATE leagues SET max_members = %s WHERE league_id = %s", (max_members, league_id))
-                conn.commit()
-                return cur.rowcount > 0
-        except Exception as e:
-            self.logger.error(f"Failed to update max_members: {e}")
-            raise
+        _cache_discard("league", league_id)
+        return self._write(_UPDATE_MAX_MEMBERS_SQL, (max_members, league_id), "update max_members")
 
     def update_book(self, league_id: int, book_id: int) -> bool:
-        try:
-            with self.db_manager.get_connection() as conn:
-                cur = conn.cursor()
-                cur.execute("UPDATE leagues SET current_book_id = %s WHERE league_id = %s", (book_id, league_id))
-                conn.commit()
-                return cur.rowcount > 0
-        except Exception as e:
-            self.logger.error(f"Failed to update book: {e}")
-            raise
+        _cache_discard("league", league_id)
+        return self._write(_UPDATE_BOOK_SQL, (book_id, league_id), "update book")
 
-    def export_league_rows(self, league_id: int) -> List[Dict]:
+    def export_league_columns(self, league_id: int) -> Dict[str, Sequence]:
+        """Export active members' reading progress as one sequence per column.
+
+        Integer columns come back as ``array('q')`` buffers, text columns as lists.
+        """
         try:
             with self.db_manager.get_connection() as conn:
-                cur = conn.cursor()
+                cur = self.db_manager.stream_cursor(conn, f"export_league_{league_id}")
                 cur.execute(
                     """
-                    SELECT u.full_name, u.city, b.title, b.author, b.total_pages,
-                           ub.pages_read, ub.start_date, ub.last_updated
+                    SELECT COALESCE(u.full_name, ''), COALESCE(u.city, ''),
+                           COALESCE(b.title, ''), COALESCE(b.author, ''),
+                           CAST(COALESCE(b.total_pages, 0) AS INTEGER),
+                           CAST(COALESCE(ub.pages_read, 0) AS INTEGER),
+                           COALESCE(CAST(ub.start_date AS TEXT), ''),
+                           COALESCE(CAST(ub.last_updated AS TEXT), '')
                     FROM league_members lm
                     JOIN users u ON u.user_id = lm.user_id
                     LEFT JOIN user_books ub ON ub.user_id = lm.user_id
@@ -445,23 +561,16 @@ class LeagueRepository:
                     """,
                     (league_id,),
                 )
-                rows = cur.fetchall()
-                out: List[Dict] = []
-                for r in rows:
-                    out.append(
-                        {
-                            "full_name": r['full_name'] or "",
-                            
-                            "city": r['city'] or "",
-                            "book_title": r['title'] or "",
-                            "book_author": r['author'] or "",
-                            "total_pages": int(r['total_pages'] or 0),
-                            "pages_read": int(r['pages_read'] or 0),
-                            "start_date": str(r['start_date'] or ""),
-                            "last_updated": str(r['last_updated'] or ""),
-                        }
-                    )
-                return out
+                # NULL defaults and typing are applied by the query; each batch
+                # is only transposed onto the columns, so the full row list is
+                # never held in memory
+                columns = _export_columns([()] * len(EXPORT_COLUMNS))
+                rows = cur.fetchmany(_EXPORT_BATCH_SIZE)
+                while rows:
+                    for column, values in zip(columns.values(), zip(*rows)):
+                        column.extend(values)
+                    rows = cur.fetchmany(_EXPORT_BATCH_SIZE)
+                return columns
         except Exception as e:
-            self.logger.error(f"Failed to export league rows: {e}")
-            return []
+            self.logger.error("Failed to export league rows: %s", e)
+            return _export_columns([()] * len(EXPORT_COLUMNS))
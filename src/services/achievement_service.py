@@ -9,7 +9,7 @@ from datetime import datetime, date, timedelta
 from typing import List, Optional, Dict, Any, Tuple
 import json
 
-from src.database.database import db_manager
+from src.database.database import get_db_manager
 from src.database.models.achievement import Achievement, AchievementDefinition, UserStats
 
 
@@ -19,7 +19,7 @@ class AchievementService:
     def __init__(self):
         """Initialize the achievement service."""
         self.logger = logging.getLogger(__name__)
-        self.db_manager = db_manager
+        self.db_manager = get_db_manager()
     
     def get_user_stats(self, user_id: int) -> Optional[UserStats]:
         """Get user statistics."""
@@ -524,19 +524,16 @@ class AchievementService:
         """Get user's recent achievements."""
         try:
             with self.db_manager.get_connection() as conn:
-                cursor = conn.cursor()
+                cursor = self.db_manager.tuple_cursor(conn)
                 cursor.execute('''
-                    SELECT * FROM achievements 
+                    SELECT id, user_id, type, title, description, earned_at, metadata, is_notified
+                    FROM achievements 
                     WHERE user_id = %s 
                     ORDER BY earned_at DESC 
                     LIMIT %s
                 ''', (user_id, limit))
                 
-                achievements = []
-                for row in cursor.fetchall():
-                    achievements.append(Achievement.from_dict(dict(row)))
-                
-                return achievements
+                return [Achievement.from_row(row) for row in cursor.fetchall()]
                 
         except Exception as e:
             self.logger.error(f"Failed to get achievements for user {user_id}: {e}")
@@ -563,18 +560,15 @@ class AchievementService:
         """Get all achievement definitions."""
         try:
             with self.db_manager.get_connection() as conn:
-                cursor = conn.cursor()
+                cursor = self.db_manager.tuple_cursor(conn)
                 cursor.execute('''
-                    SELECT * FROM achievement_definitions 
+                    SELECT id, type, title, description, icon, xp_reward, is_active, created_at
+                    FROM achievement_definitions 
                     WHERE is_active = 1 
                     ORDER BY xp_reward ASC
                 ''')
                 
-                definitions = []
-                for row in cursor.fetchall():
-                    definitions.append(AchievementDefinition.from_dict(dict(row)))
-                
-                return definitions
+                return [AchievementDefinition.from_row(row) for row in cursor.fetchall()]
                 
         except Exception as e:
             self.logger.error(f"Failed to get achievement definitions: {e}")
@@ -655,20 +649,17 @@ class AchievementService:
         """Get user's achievements within a specific league."""
         try:
             with self.db_manager.get_connection() as conn:
-                cursor = conn.cursor()
+                cursor = self.db_manager.tuple_cursor(conn)
                 cursor.execute('''
-                    SELECT * FROM achievements 
+                    SELECT id, user_id, type, title, description, earned_at, metadata, is_notified
+                    FROM achievements 
                     WHERE user_id = %s 
                     AND (metadata LIKE '%%"league_id":' || %s || '%%' OR type IN ('community_contributor', 'league_champion'))
                     ORDER BY earned_at DESC 
                     LIMIT %s
                 ''', (user_id, league_id, limit))
                 
-                achievements = []
-                for row in cursor.fetchall():
-                    achievements.append(Achievement.from_dict(dict(row)))
-                
-                return achievements
+                return [Achievement.from_row(row) for row in cursor.fetchall()]
                 
         except Exception as e:
             self.logger.error(f"Failed to get league achievements for user {user_id}, league {league_id}: {e}")
@@ -4,14 +4,14 @@ Book service for featured books, user reading, and progress updates.
 
 from typing import List, Dict, Optional
 from datetime import date
-from src.database.database import db_manager
+from src.database.database import get_db_manager
 
 
 class BookService:
     """Provides book listing and user reading operations."""
 
     def get_user_daily_goal(self, user_id: int) -> int:
-        with db_manager.get_connection() as conn:
+        with get_db_manager().get_connection(readonly=True) as conn:
             cur = conn.cursor()
             cur.execute("SELECT daily_goal FROM users WHERE user_id = %s", (user_id,))
             row = cur.fetchone()
@@ -23,7 +23,7 @@ class BookService:
                 return 20
 
     def set_user_daily_goal(self, user_id: int, pages_per_day: int) -> None:
-        with db_manager.get_connection() as conn:
+        with get_db_manager().get_connection() as conn:
             cur = conn.cursor()
             cur.execute(
                 """
@@ -36,7 +36,7 @@ class BookService:
             conn.commit()
 
     def get_featured_books(self) -> List[Dict]:
-        with db_manager.get_connection() as conn:
+        with get_db_manager().get_connection(readonly=True) as conn:
             cur = conn.cursor()
             cur.execute(
                 """
@@ -58,7 +58,7 @@ class BookService:
 
     def add_custom_book_and_start(self, user_id: int, title: str, author: str, total_pages: int) -> int:
         """Create a user-added book and start reading it. Returns book_id."""
-        with db_manager.get_connection() as conn:
+        with get_db_manager().get_connection() as conn:
             cur = conn.cursor()
             cur.execute(
                 """
@@ -81,7 +81,7 @@ class BookService:
             return book_id
 
     def start_reading(self, user_id: int, book_id: int) -> bool:
-        with db_manager.get_connection() as conn:
+        with get_db_manager().get_connection() as conn:
             cur = conn.cursor()
             # if already active, do nothing
             cur.execute(
@@ -104,7 +104,7 @@ class BookService:
             return True
 
     def get_active_books(self, user_id: int) -> List[Dict]:
-        with db_manager.get_connection() as conn:
+        with get_db_manager().get_connection(readonly=True) as conn:
             cur = conn.cursor()
             cur.execute(
                 """
@@ -138,7 +138,7 @@ class BookService:
 
     def get_user_books_with_status(self, user_id: int) -> List[Dict]:
         """Return all books for a user with status label and counts."""
-        with db_manager.get_connection() as conn:
+        with get_db_manager().get_connection(readonly=True) as conn:
             cur = conn.cursor()
             cur.execute(
                 """
@@ -169,7 +169,7 @@ class BookService:
 
     def delete_user_book(self, user_id: int, book_id: int) -> bool:
         """Delete a user's registered book: remove sessions and user_books; delete book row if custom and unused."""
-        with db_manager.get_connection() as conn:
+        with get_db_manager().get_connection() as conn:
             cur = conn.cursor()
             # Ensure ownership exists
             cur.execute(
@@ -210,7 +210,7 @@ class BookService:
             return True
 
     def update_progress(self, user_id: int, book_id: int, pages_read: int) -> Dict:
-        with db_manager.get_connection() as conn:
+        with get_db_manager().get_connection() as conn:
             cur = conn.cursor()
             # get total pages
             cur.execute("SELECT total_pages FROM books WHERE book_id = %s", (book_id,))
@@ -275,7 +275,7 @@ class BookService:
 
     def update_progress_with_context(self, user_id: int, book_id: int, pages_read: int, league_id: Optional[int] = None) -> Dict:
         """Update progress and record session with optional league context."""
-        with db_manager.get_connection() as conn:
+        with get_db_manager().get_connection() as conn:
             cur = conn.cursor()
             # get total pages
             cur.execute("SELECT total_pages FROM books WHERE book_id = %s", (book_id,))
@@ -339,7 +339,7 @@ class BookService:
             }
 
     def get_user_stats(self, user_id: int) -> Dict:
-        with db_manager.get_connection() as conn:
+        with get_db_manager().get_connection(readonly=True) as conn:
             cur = conn.cursor()
             cur.execute("SELECT COUNT(*) as count FROM user_books WHERE user_id = %s", (user_id,))
             total_books = int(cur.fetchone()['count'] or 0)
@@ -2,11 +2,33 @@
 Service factory to create service instances with proper dependencies.
 """
 
-from src.database.database import db_manager
-from src.database.repositories.league_repository import LeagueRepository
+from functools import lru_cache
+
+from src.database.database import get_db_manager
+from src.database.repositories.league_repository import LeagueRepository, begin_request_cache
+from src.services.book_service import BookService
 from src.services.league_service import LeagueService
+from src.services.reminder_service import ReminderService
+
+
+def begin_request() -> None:
+    """Start fresh per-update caches; call once at the start of each update."""
+    begin_request_cache()
+
 
 def get_league_service() -> LeagueService:
     """Create a LeagueService with database manager."""
-    repo = LeagueRepository(db_manager)
+    repo = LeagueRepository(get_db_manager())
     return LeagueService(repo)
+
+
+@lru_cache(maxsize=1)
+def get_book_service() -> BookService:
+    """Return the shared BookService instance."""
+    return BookService()
+
+
+@lru_cache(maxsize=1)
+def get_reminder_service() -> ReminderService:
+    """Return the shared ReminderService instance."""
+    return ReminderService()
@@ -13,7 +13,20 @@ from src.database.models.league import League
 from src.database.models.league_member import LeagueMember
 from src.config.constants import LeagueStatus
 from src.config.settings import DEFAULT_LEAGUE_DURATION_DAYS
-from src.database.database import db_manager
+from src.database.database import get_db_manager
+
+
+_LEADERBOARD_SQL = """
+    SELECT u.full_name, ub.user_id, b.title,
+           ub.pages_read, b.total_pages,
+           ROUND(CASE WHEN b.total_pages > 0 THEN (ub.pages_read * 100.0) / b.total_pages ELSE 0 END, 1) AS pct
+    FROM league_members lm
+    JOIN users u ON u.user_id = lm.user_id
+    JOIN user_books ub ON ub.user_id = lm.user_id
+    JOIN books b ON b.book_id = ub.book_id
+    WHERE lm.league_id = %s AND lm.is_active = TRUE
+    ORDER BY pct DESC, ub.pages_read DESC
+"""
 
 
 class LeagueService:
@@ -65,11 +78,10 @@ class LeagueService:
                 description=description
             )
             
-            # Save to database
-            league_id = self.league_repo.create_league(league)
-            
-            # Add admin as first member
-            self.league_repo.add_member_to_league(league_id, admin_id)
+            # Save the league and its admin membership in one commit
+            with self.league_repo.transaction():
+                league_id = self.league_repo.create_league(league)
+                self.league_repo.add_member_to_league(league_id, admin_id)
             
             self.logger.info(f"Created league '{name}' with ID {league_id}")
             return True, f"League '{name}' created successfully!", league_id
@@ -80,23 +92,12 @@ class LeagueService:
     
     def get_available_leagues(self, user_id: int) -> List[League]:
         """Get leagues available for a user to join."""
+        return [league for league, _ in self.get_available_leagues_with_counts(user_id)]
+
+    def get_available_leagues_with_counts(self, user_id: int) -> List[Tuple[League, int]]:
+        """Get leagues available for a user to join, paired with their member counts."""
         try:
-            # Get all active leagues
-            active_leagues = self.league_repo.get_active_leagues()
-            
-            # Filter out leagues the user is already a member of
-            available_leagues = []
-            for league in active_leagues:
-                if not self.league_repo.is_user_member(league.league_id, user_id):
-                    # Check if league is full
-                    member_count = self.league_repo.get_league_member_count(
-                        league.league_id
-                    )
-                    if member_count < league.max_members:
-                        available_leagues.append(league)
-            
-            return available_leagues
-            
+            return self.league_repo.get_available_leagues_with_counts(user_id)
         except Exception as e:
             self.logger.error(f"Failed to get available leagues: {e}")
             return []
@@ -117,23 +118,15 @@ class LeagueService:
             if not league.is_active:
                 return False, "League is not active"
             
-            # Check if user is already a member
-            if self.league_repo.is_user_member(league_id, user_id):
-                return False, "You are already a member of this league"
-            
-            # Check if league is full
-            member_count = self.league_repo.get_league_member_count(league_id)
-            if member_count >= league.max_members:
-                return False, "League is full"
-            
-            # Add user to league
-            success = self.league_repo.add_member_to_league(league_id, user_id)
-            
-            if success:
+            # Membership and capacity are checked by the insert itself
+            if self.league_repo.add_member_to_league(league_id, user_id):
                 self.logger.info(f"User {user_id} joined league {league_id}")
                 return True, f"Successfully joined '{league.name}'!"
-            else:
-                return False, "Failed to join league"
+            
+            # Only a failed join needs to find out why
+            if self.league_repo.is_user_member(league_id, user_id):
+                return False, "You are already a member of this league"
+            return False, "League is full"
                 
         except Exception as e:
             self.logger.error(f"Failed to join league: {e}")
@@ -172,6 +165,14 @@ class LeagueService:
             self.logger.error(f"Failed to get user leagues: {e}")
             return []
 
+    def get_user_leagues_with_counts(self, user_id: int) -> List[Tuple[League, int]]:
+        """Get all leagues a user is a member of, paired with their member counts."""
+        try:
+            return self.league_repo.get_user_leagues_with_counts(user_id)
+        except Exception as e:
+            self.logger.error(f"Failed to get user leagues: {e}")
+            return []
+
     def get_league_by_id(self, league_id: int) -> Optional[League]:
         """Get league by ID."""
         try:
@@ -208,43 +209,27 @@ class LeagueService:
             self.logger.error(f"Failed to get league info: {e}")
             return None
     
-    def get_league_leaderboard(self, league_id: int) -> List[Dict]:
+    async def get_league_leaderboard(self, league_id: int) -> List[Dict]:
         """Compute a simple leaderboard for a league based on user progress."""
         try:
-            with db_manager.get_connection() as conn:
-                cur = conn.cursor()
-                cur.execute(
-                    """
-                    SELECT u.full_name, ub.user_id, b.title,
-                           ub.pages_read, b.total_pages,
-                           ROUND(CASE WHEN b.total_pages > 0 THEN (ub.pages_read * 100.0) / b.total_pages ELSE 0 END, 1) AS pct
-                    FROM league_members lm
-                    JOIN users u ON u.user_id = lm.user_id
-                    JOIN user_books ub ON ub.user_id = lm.user_id
-                    JOIN books b ON b.book_id = ub.book_id
-                    WHERE lm.league_id = %s AND lm.is_active = TRUE
-                    ORDER BY pct DESC, ub.pages_read DESC
-                    """,
-                    (league_id,),
+            rows = await get_db_manager().fetch_all_async(_LEADERBOARD_SQL, (league_id,))
+            leaderboard: List[Dict] = []
+            rank = 1
+            for r in rows:
+                leaderboard.append(
+                    {
+                        "rank": rank,
+                        "full_name": r['full_name'] or "",
+                        
+                        "user_id": r['user_id'],
+                        "book_title": r['title'],
+                        "pages_read": int(r['pages_read'] or 0),
+                        "total_pages": int(r['total_pages'] or 0),
+                        "progress_percent": float(r['pct'] or 0.0),
+                    }
                 )
-                rows = cur.fetchall()
-                leaderboard: List[Dict] = []
-                rank = 1
-                for r in rows:
-                    leaderboard.append(
-                        {
-                            "rank": rank,
-                            "full_name": r['full_name'] or "",
-                            
-                            "user_id": r['user_id'],
-                            "book_title": r['title'],
-                            "pages_read": int(r['pages_read'] or 0),
-                            "total_pages": int(r['total_pages'] or 0),
-                            "progress_percent": float(r['pct'] or 0.0),
-                        }
-                    )
-                    rank += 1
-                return leaderboard
+                rank += 1
+            return leaderboard
         except Exception as e:
             self.logger.error(f"Failed to get leaderboard: {e}")
             return []
@@ -10,7 +10,7 @@ import json
 from datetime import datetime, date, timedelta
 from typing import List, Optional, Dict, Any
 
-from src.database.database import db_manager
+from src.database.database import get_db_manager
 from src.database.models.motivation import MotivationMessage, MessageType
 from src.services.achievement_service import AchievementService
 
@@ -21,7 +21,7 @@ class MotivationService:
     def __init__(self):
         """Initialize the motivation service."""
         self.logger = logging.getLogger(__name__)
-        self.db_manager = db_manager
+        self.db_manager = get_db_manager()
         self.achievement_service = AchievementService()
     
     def _next_challenge_hint(self, achievement_type: str, metadata: Dict[str, Any] = None) -> Optional[str]:
@@ -6,7 +6,7 @@ from typing import Optional, List, Dict
 from datetime import time
 import re
 
-from src.database.database import db_manager
+from src.database.database import get_db_manager
 
 
 class ReminderService:
@@ -63,7 +63,7 @@ class ReminderService:
         return f"{out_h}:{mm:02d} {ampm}"
 
     def set_reminder(self, user_id: int, t: time, frequency: str = "daily") -> None:
-        with db_manager.get_connection() as conn:
+        with get_db_manager().get_connection() as conn:
             cur = conn.cursor()
             # update-then-insert to avoid ON CONFLICT requirement
             cur.execute(
@@ -85,7 +85,7 @@ class ReminderService:
             conn.commit()
 
     def get_reminder(self, user_id: int) -> Optional[Dict]:
-        with db_manager.get_connection() as conn:
+        with get_db_manager().get_connection() as conn:
             cur = conn.cursor()
             cur.execute(
                 "SELECT reminder_time, frequency, is_active, last_sent FROM reminders WHERE user_id = %s",
@@ -102,14 +102,14 @@ class ReminderService:
             }
 
     def remove_reminder(self, user_id: int) -> bool:
-        with db_manager.get_connection() as conn:
+        with get_db_manager().get_connection() as conn:
             cur = conn.cursor()
             cur.execute("UPDATE reminders SET is_active = FALSE WHERE user_id = %s", (user_id,))
             conn.commit()
             return cur.rowcount > 0
 
     def list_active_reminders(self) -> List[Dict]:
-        with db_manager.get_connection() as conn:
+        with get_db_manager().get_connection() as conn:
             cur = conn.cursor()
             cur.execute(
                 "SELECT user_id, reminder_time, frequency FROM reminders WHERE is_active = TRUE"
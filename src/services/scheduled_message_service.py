@@ -10,7 +10,7 @@ from datetime import datetime, time, timedelta
 from typing import List, Optional
 import random
 
-from src.database.database import db_manager
+from src.database.database import get_db_manager
 from src.services.motivation_service import MotivationService
 import re
 from src.config.motivational_quotes import get_random_quote, get_quote_by_category
@@ -23,7 +23,7 @@ class ScheduledMessageService:
     def __init__(self):
         """Initialize the scheduled message service."""
         self.logger = logging.getLogger(__name__)
-        self.db_manager = db_manager
+        self.db_manager = get_db_manager()
         self.motivation_service = MotivationService()
         
         # Default times for messages (UTC timezone)
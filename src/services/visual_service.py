@@ -8,7 +8,7 @@ import logging
 from datetime import datetime, timedelta
 from typing import List, Optional, Dict, Any, Tuple
 
-from src.database.database import db_manager
+from src.database.database import get_db_manager
 from src.database.models.motivation import VisualElement, VisualElementType
 from src.services.achievement_service import AchievementService
 
@@ -19,7 +19,7 @@ class VisualService:
     def __init__(self):
         """Initialize the visual service."""
         self.logger = logging.getLogger(__name__)
-        self.db_manager = db_manager
+        self.db_manager = get_db_manager()
         self.achievement_service = AchievementService()
     
     def create_progress_bar(self, current: int, total: int, width: int = 10, 
@@ -0,0 +1,31 @@
+"""
+Test the service factory.
+
+BookService and ReminderService are shared singletons, so handlers built
+more than once reuse the same instances.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+# Ensure project root is on PYTHONPATH; settings refuse to load without a token
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault('BOT_TOKEN', 'test-token')
+
+from src.services.factory import get_book_service, get_reminder_service
+
+
+def test_services_are_shared():
+    assert get_book_service() is get_book_service()
+    assert get_reminder_service() is get_reminder_service()
+
+
+def test_handlers_reuse_shared_services():
+    from src.core.handlers.admin_handlers import AdminHandlers
+    from src.core.handlers.user_handlers import UserHandlers
+
+    first, second = UserHandlers(), UserHandlers()
+    assert first.book_service is second.book_service is get_book_service()
+    assert first.reminder_service is second.reminder_service is get_reminder_service()
+    assert AdminHandlers().book_service is get_book_service()
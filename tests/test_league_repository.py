@@ -0,0 +1,267 @@
+"""
+Test LeagueRepository against a throwaway SQLite database.
+"""
+
+import os
+import sys
+from array import array
+from datetime import date, datetime
+from pathlib import Path
+
+import pytest
+
+# Ensure project root is on PYTHONPATH; settings refuse to load without a token
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+os.environ.setdefault('BOT_TOKEN', 'test-token')
+
+from src.config.constants import LeagueStatus
+from src.database import database
+from src.database.models.league import League
+from src.database.repositories import league_repository
+from src.database.repositories.league_repository import EXPORT_COLUMNS, LeagueRepository
+
+
+ADMIN_ID = 1
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    monkeypatch.setattr(database, 'DB_TYPE', 'sqlite')
+    monkeypatch.setattr(database, 'SQLITE_DB_PATH', str(tmp_path / 'test.db'))
+    manager = database.DatabaseManager()
+    manager.init_database()
+    with manager.get_connection() as conn:
+        cur = conn.cursor()
+        for user_id in range(1, 9):
+            cur.execute(
+                "INSERT INTO users (user_id, full_name, city) VALUES (%s, %s, %s)",
+                (user_id, f"User {user_id}", 'Addis'),
+            )
+        conn.commit()
+    yield manager
+    manager.close_all()
+
+
+@pytest.fixture
+def repo(db):
+    return LeagueRepository(db)
+
+
+def _create_league(repo, max_members=3, daily_goal=10):
+    return repo.create_league(League(
+        None, 'Test League', 'd', ADMIN_ID, None, date(2026, 1, 1), date(2026, 2, 1),
+        daily_goal, max_members, LeagueStatus.ACTIVE, datetime(2026, 1, 1),
+    ))
+
+
+def test_export_league_columns(db, repo, monkeypatch):
+    # A small batch size exercises the batch-by-batch transposition
+    monkeypatch.setattr(league_repository, '_EXPORT_BATCH_SIZE', 2)
+    league_id = _create_league(repo, max_members=5)
+    for user_id in (3, 1, 2):
+        repo.add_member_to_league(league_id, user_id)
+    repo.remove_member_from_league(league_id, 2)
+    with db.get_connection() as conn:
+        cur = conn.cursor()
+        cur.execute(
+            "INSERT INTO books (title, author, total_pages) VALUES (%s, %s, %s) RETURNING book_id",
+            ('Export Test Book', 'Author', 400),
+        )
+        book_id = cur.fetchone()['book_id']
+        cur.execute(
+            "INSERT INTO user_books (user_id, book_id, pages_read, start_date, last_updated) "
+            "VALUES (%s, %s, %s, %s, %s)",
+            (1, book_id, 120, '2026-01-03', '2026-01-04'),
+        )
+        conn.commit()
+
+    columns = repo.export_league_columns(league_id)
+
+    assert tuple(columns) == EXPORT_COLUMNS
+    assert columns['full_name'] == ['User 1', 'User 3']
+    assert columns['city'] == ['Addis', 'Addis']
+    assert columns['book_title'] == ['Export Test Book', '']
+    assert columns['total_pages'] == array('q', [400, 0])
+    assert columns['pages_read'] == array('q', [120, 0])
+    assert columns['start_date'] == ['2026-01-03', '']
+    assert columns['last_updated'] == ['2026-01-04', '']
+
+
+def test_export_league_columns_empty(repo):
+    columns = repo.export_league_columns(_create_league(repo))
+
+    assert tuple(columns) == EXPORT_COLUMNS
+    assert all(len(values) == 0 for values in columns.values())
+
+
+def test_add_member_guards(repo):
+    league_id = _create_league(repo, max_members=2)
+
+    assert repo.add_member_to_league(league_id, 1)
+    assert not repo.add_member_to_league(league_id, 1)  # already a member
+    assert repo.add_member_to_league(league_id, 2)
+    assert not repo.add_member_to_league(league_id, 3)  # full
+    assert not repo.add_member_to_league(league_id + 1, 3)  # no such league
+    assert repo.get_league_member_count(league_id) == 2
+
+
+def test_add_member_reactivates_former_member(repo):
+    league_id = _create_league(repo, max_members=2)
+    repo.add_member_to_league(league_id, 1)
+    repo.add_member_to_league(league_id, 2)
+
+    assert repo.remove_member_from_league(league_id, 2)
+    assert not repo.is_user_member(league_id, 2)
+    assert repo.add_member_to_league(league_id, 2)
+    assert repo.is_user_member(league_id, 2)
+    assert sorted(m.user_id for m in repo.get_league_members(league_id)) == [1, 2]
+
+
+def test_league_row_locked_only_on_postgres(repo, monkeypatch):
+    class Cursor:
+        def __init__(self):
+            self.executed = []
+
+        def execute(self, sql, params):
+            self.executed.append((sql, params))
+
+    cursor = Cursor()
+    repo._lock_league(cursor, 7)
+    assert cursor.executed == []
+
+    monkeypatch.setattr(repo.db_manager, 'db_type', 'postgres')
+    repo._lock_league(cursor, 7)
+    assert cursor.executed == [(league_repository._LOCK_LEAGUE_SQL, (7,))]
+
+
+def test_add_members_respects_capacity(repo):
+    league_id = _create_league(repo, max_members=4)
+    repo.add_member_to_league(league_id, 1)
+
+    repo.add_members_to_league(league_id, [1, 2, 3, 4, 5, 6])
+
+    assert repo.get_league_member_count(league_id) == 4
+    assert repo.are_users_members(league_id, range(1, 9)) == {1, 2, 3, 4}
+
+
+def test_add_members_joins_open_transaction(repo):
+    league_id = _create_league(repo, max_members=5)
+
+    with pytest.raises(RuntimeError):
+        with repo.transaction():
+            repo.add_members_to_league(league_id, [1, 2])
+            raise RuntimeError("boom")
+
+    assert repo.get_league_member_count(league_id) == 0
+
+
+def test_are_users_members(repo, monkeypatch):
+    # A small chunk size splits the IN list across several statements
+    monkeypatch.setattr(league_repository, '_IN_CHUNK_SIZE', 2)
+    league_id = _create_league(repo, max_members=5)
+    repo.add_members_to_league(league_id, [2, 3, 5, 6])
+    repo.remove_member_from_league(league_id, 3)
+
+    assert repo.are_users_members(league_id, range(1, 9)) == {2, 5, 6}
+    assert repo.are_users_members(league_id, []) == set()
+
+
+def test_get_available_leagues_with_counts(repo):
+    full = _create_league(repo, max_members=1)
+    joined = _create_league(repo)
+    open_league = _create_league(repo)
+    closed = _create_league(repo)
+    repo.add_member_to_league(full, 2)
+    repo.add_member_to_league(joined, 1)
+    repo.add_members_to_league(open_league, [2, 3])
+    repo.update_league_status(closed, LeagueStatus.COMPLETED)
+
+    available = repo.get_available_leagues_with_counts(1)
+
+    assert [(league.league_id, count) for league, count in available] == [(open_league, 2)]
+    assert available[0][0].status is LeagueStatus.ACTIVE
+
+
+@pytest.fixture
+def request_cache():
+    token = league_repository._request_cache.set({})
+    yield
+    league_repository._request_cache.reset(token)
+
+
+def _set_goal_directly(db, league_id, daily_goal):
+    """Change a league behind the repository's back."""
+    with db.get_connection() as conn:
+        conn.cursor().execute(
+            "UPDATE leagues SET daily_goal = %s WHERE league_id = %s", (daily_goal, league_id)
+        )
+        conn.commit()
+
+
+def test_nothing_cached_outside_an_update(db, repo):
+    league_id = _create_league(repo, daily_goal=10)
+    repo.get_league_by_id(league_id)
+
+    _set_goal_directly(db, league_id, 20)
+
+    assert repo.get_league_by_id(league_id).daily_goal == 20
+
+
+def test_mutators_invalidate_request_cache(db, repo, request_cache):
+    league_id = _create_league(repo, daily_goal=10)
+    assert repo.get_league_by_id(league_id).daily_goal == 10
+    assert repo.get_league_member_count(league_id) == 0
+
+    _set_goal_directly(db, league_id, 20)
+    assert repo.get_league_by_id(league_id).daily_goal == 10  # served from the cache
+
+    repo.update_goal(league_id, 30)
+    repo.add_member_to_league(league_id, 1)
+    assert repo.get_league_by_id(league_id).daily_goal == 30
+    assert repo.get_league_member_count(league_id) == 1
+
+
+def test_cached_leagues_are_copies(repo, request_cache):
+    league_id = _create_league(repo, daily_goal=10)
+    first = repo.get_league_by_id(league_id)
+    first.daily_goal = 99
+
+    second = repo.get_league_by_id(league_id)
+    assert second is not first
+    assert second.daily_goal == 10
+
+
+def test_transaction_flushes_request_cache(repo, request_cache):
+    league_id = _create_league(repo, daily_goal=10)
+
+    with repo.transaction():
+        repo.update_goal(league_id, 44)
+        # Reads inside the block see committed data and cache it
+        assert repo.get_league_by_id(league_id).daily_goal == 10
+
+    assert repo.get_league_by_id(league_id).daily_goal == 44
+
+
+def test_transaction_commits_together(repo):
+    league_id = _create_league(repo)
+
+    with repo.transaction():
+        repo.update_goal(league_id, 44)
+        with repo.transaction():
+            repo.update_max_members(league_id, 7)
+
+    league = repo.get_league_by_id(league_id)
+    assert (league.daily_goal, league.max_members) == (44, 7)
+
+
+def test_transaction_rolls_back_on_error(repo):
+    league_id = _create_league(repo, daily_goal=10)
+
+    with pytest.raises(RuntimeError):
+        with repo.transaction():
+            repo.update_goal(league_id, 99)
+            repo.add_member_to_league(league_id, 1)
+            raise RuntimeError("boom")
+
+    assert repo.get_league_by_id(league_id).daily_goal == 10
+    assert not repo.is_user_member(league_id, 1)
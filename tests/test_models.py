@@ -0,0 +1,50 @@
+"""
+Test model serialization.
+
+Metadata is written with the stdlib json.dumps formatting, and tuple rows
+read back through ``from_row`` match what ``from_dict`` builds.
+"""
+
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# Ensure project root is on PYTHONPATH
+sys.path.append(str(Path(__file__).resolve().parents[1]))
+
+from src.database.models.achievement import Achievement, AchievementDefinition
+from src.database.models.motivation import MotivationMessage
+
+
+STAMP = datetime(2026, 1, 2, 3, 4, 5)
+METADATA = {'league_id': 3, 'pages': [50, 100], 'note': 'አንባቢ'}
+
+
+def test_achievement_metadata_matches_json_dumps():
+    achievement = Achievement(1, 2, 'pages_100', 'Pages', 'd', STAMP, METADATA)
+    assert achievement.to_dict()['metadata'] == json.dumps(METADATA)
+    assert Achievement.from_dict(achievement.to_dict()).metadata == METADATA
+
+
+def test_motivation_metadata_matches_json_dumps():
+    message = MotivationMessage(1, 2, 't', 'c', STAMP, False, METADATA)
+    assert message.to_dict()['metadata'] == json.dumps(METADATA)
+    assert MotivationMessage.from_dict(message.to_dict()) == message
+    assert MotivationMessage(None, 2, 't', 'c', STAMP).to_dict()['metadata'] is None
+
+
+def test_achievement_from_row_round_trip():
+    row = (1, 2, 'speed_reader', 'Speed Reader', 'd', '2026-01-02T03:04:05', '{"pages": 50}', 0)
+    achievement = Achievement.from_row(row)
+    assert achievement == Achievement(1, 2, 'speed_reader', 'Speed Reader', 'd', STAMP, {'pages': 50}, False)
+    assert Achievement.from_dict(achievement.to_dict()) == achievement
+    assert Achievement.from_row(row[:6] + (None, 1)).metadata is None
+    assert Achievement.from_row(row[:6] + ('not json', 1)).metadata is None
+
+
+def test_achievement_definition_from_row_round_trip():
+    row = (3, '1_day_streak', 'First Step', 'd', 'x', 10, 1, '2026-01-02 03:04:05')
+    definition = AchievementDefinition.from_row(row)
+    assert definition == AchievementDefinition(3, '1_day_streak', 'First Step', 'd', 'x', 10, True, STAMP)
+    assert AchievementDefinition.from_dict(definition.to_dict()) == definition